@@ -3,27 +3,58 @@
 This is the main entry point for the saha CLI. Commands are organized into modules:
 - saha/commands/execution.py: Agentic loop commands (run, resume, status, tools, clean, version)
 - saha/commands/plugin.py: Plugin management commands (plugin, claude)
+
+The Typer app is built lazily: `saha version` / `saha --version` are answered
+straight from argv without importing typer or registering any commands.
 """
 
-import typer
+import functools
+import sys
+from typing import TYPE_CHECKING, Any
+
+from saha import __version__
+
+if TYPE_CHECKING:
+    import typer
+
+# Invocations answered before the Typer app is constructed
+_VERSION_ARGVS = (["version"], ["--version"])
+
 
-from saha.commands.execution import register_execution_commands
-from saha.commands.plugin import register_plugin_commands
+@functools.lru_cache(maxsize=1)
+def create_app() -> "typer.Typer":
+    """Build the Typer app and register all command groups."""
+    import typer
 
-app = typer.Typer(
-    name="saha",
-    help="Agentic loop orchestrator for Sahaidachny task execution.",
-    no_args_is_help=True,
-)
+    from saha.commands.execution import register_execution_commands
+    from saha.commands.plugin import register_plugin_commands
 
-# Register command groups
-register_execution_commands(app)
-register_plugin_commands(app)
+    app = typer.Typer(
+        name="saha",
+        help="Agentic loop orchestrator for Sahaidachny task execution.",
+        no_args_is_help=True,
+    )
+
+    # Register command groups
+    register_execution_commands(app)
+    register_plugin_commands(app)
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `saha.cli.app` available for callers that import it directly
+    if name == "app":
+        return create_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
     """Entry point for the CLI."""
-    app()
+    if sys.argv[1:] in _VERSION_ARGVS:
+        sys.stdout.write(f"saha version {__version__}\n")
+        return
+
+    create_app()()
 
 
 if __name__ == "__main__":
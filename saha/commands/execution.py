@@ -8,37 +8,58 @@ This module contains commands for running and managing the agentic execution loo
 - tools: List available code quality tools
 - clean: Remove execution state files
 - version: Show version information
+
+Heavy dependencies (orchestrator, verification, settings) are imported inside
+the command implementations so that --help, version and shell completion stay cheap.
 """
 
+from __future__ import annotations
+
+import functools
+import os
 import subprocess
 import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
 
 from saha import __version__
 from saha.commands.common import setup_logging
-from saha.commands.plugin import sync_claude_artifacts
-from saha.config.settings import Settings
-from saha.context import clear_current_task, get_current_task, resolve_task_id, set_current_task
-from saha.models.state import ExecutionState, LoopPhase
-from saha.orchestrator.factory import create_orchestrator
-from saha.orchestrator.loop import LoopConfig
-from saha.orchestrator.state import StateManager
-from saha.tools.registry import create_default_registry
-from saha.verification import (
-    TaskVerifier,
-    VerificationResult,
-    VerificationStatus,
-    cleanup_template_artifacts,
-)
+
+if TYPE_CHECKING:
+    from saha.config.settings import Settings
+    from saha.models.state import ExecutionState
+    from saha.orchestrator.state import StateManager
+    from saha.tools.registry import Tool, ToolRegistry
+    from saha.verification import VerificationResult
 
 # Constants
 DEFAULT_MAX_ITERATIONS = 5
 
+# AgentsConfig fields switched together by --runner
+_EXECUTION_AGENT_FIELDS = ("implementer", "qa", "code_quality", "manager", "dod")
+
+# Styled verification labels, keyed by VerificationStatus value (built once, not per call)
+_STATUS_SYMBOLS = {
+    "passed": typer.style("PASSED", fg=typer.colors.GREEN, bold=True),
+    "warnings": typer.style("WARNINGS", fg=typer.colors.YELLOW, bold=True),
+    "failed": typer.style("FAILED", fg=typer.colors.RED, bold=True),
+}
+# Per-check report line templates, formatted with (name, message)
+_CHECK_OK_LINE = "  " + typer.style("[ok]", fg=typer.colors.GREEN) + " %s: %s"
+_CHECK_WARN_LINE = "  " + typer.style("[warn]", fg=typer.colors.YELLOW) + " %s: %s"
+_CHECK_FAIL_LINE = "  " + typer.style("[fail]", fg=typer.colors.RED) + " %s: %s"
+
+
+def _parse_tools(tools: str | None) -> list[str] | None:
+    """Parse the comma-separated --tools value, trimming whitespace and empty names."""
+    if not tools:
+        return None
+    return [name for part in tools.split(",") if (name := part.strip())] or None
+
 
 def _parse_duration(duration_str: str) -> int:
     """Parse duration string (e.g., 1h, 30m, 10s) to seconds."""
@@ -82,26 +103,83 @@ def _calculate_scheduled_at(delay: str | None, at: str | None) -> datetime:
     return now
 
 
+@functools.lru_cache(maxsize=1)
+def _default_tool_registry() -> ToolRegistry:
+    """Default tool registry, built once per process. Treat it as read-only."""
+    from saha.tools.registry import create_default_registry
+
+    return create_default_registry()
+
+
+# Seconds a tool availability probe stays valid
+_TOOL_AVAILABILITY_TTL = 60.0
+
+# Tool availability keyed by tool name: (monotonic probe time, available)
+_AVAILABILITY_CACHE: dict[str, tuple[float, bool]] = {}
+
+
+def _tool_availability(tools: list[Tool]) -> list[bool]:
+    """Check tool availability, probing expired or unknown tools concurrently."""
+    now = time.monotonic()
+    stale = [
+        tool
+        for tool in tools
+        if tool.name not in _AVAILABILITY_CACHE
+        or now - _AVAILABILITY_CACHE[tool.name][0] > _TOOL_AVAILABILITY_TTL
+    ]
+
+    if stale:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+            probes = executor.map(lambda tool: tool.is_available(), stale)
+            for tool, available in zip(stale, probes, strict=True):
+                _AVAILABILITY_CACHE[tool.name] = (now, available)
+
+    return [_AVAILABILITY_CACHE[tool.name][1] for tool in tools]
+
+
 # -----------------------------------------------------------------------------
 # Autocompletion helpers
 # -----------------------------------------------------------------------------
 
 
+# Mirrors the Settings.task_base_path default, which a unit test keeps in sync;
+# importing saha.config.settings would add pydantic to every completion
+_DEFAULT_TASK_BASE_PATH = "docs/tasks"
+
+def _list_task_dirs(task_base: Path) -> list[str]:
+    """List task directory names under the task base."""
+    # DirEntry.is_dir() reuses readdir() data, avoiding a stat() per entry
+    with os.scandir(task_base) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
+
+
+def _task_base_path_fast() -> Path:
+    """Resolve Settings.task_base_path without constructing Settings.
+
+    Reads SAHA_TASK_BASE_PATH (matched case-insensitively, like pydantic-settings)
+    and otherwise uses the Settings default. A .env file may also set it, so in
+    that case fall back to the full Settings.
+    """
+    for key, value in os.environ.items():
+        if key.upper() == "SAHA_TASK_BASE_PATH":
+            return Path(value)
+
+    if os.path.exists(".env"):
+        from saha.config.settings import get_settings
+
+        return get_settings().task_base_path
+
+    return Path(_DEFAULT_TASK_BASE_PATH)
+
+
 def _complete_task_id(incomplete: str) -> list[str]:
     """Provide autocompletion for task IDs by scanning the tasks directory."""
     try:
-        settings = Settings()
-        task_base = settings.task_base_path
-        if not task_base.exists():
-            return []
-
-        # List all directories in the task base path
-        task_dirs = [d.name for d in task_base.iterdir() if d.is_dir()]
-
-        # Filter by incomplete input
-        if incomplete:
-            return [t for t in task_dirs if t.startswith(incomplete)]
-        return task_dirs
+        # A missing task base raises FileNotFoundError, handled below
+        task_dirs = _list_task_dirs(_task_base_path_fast())
+        return [t for t in task_dirs if t.startswith(incomplete)]
     except Exception:
         return []
 
@@ -122,10 +200,13 @@ def _schedule_execution(
     settings: Settings,
 ) -> None:
     """Schedule execution for later."""
+    from saha.models.state import LoopPhase
+    from saha.orchestrator.state import StateManager
+
     scheduled_at = _calculate_scheduled_at(delay, at)
 
     state_manager = StateManager(settings.state_dir)
-    enabled_tools = tools.split(",") if tools else None
+    enabled_tools = _parse_tools(tools)
 
     # Create state and mark as scheduled
     state = state_manager.create(
@@ -217,6 +298,11 @@ def _run_command(
     at: str | None = None,
 ) -> None:
     """Implementation of the run command logic."""
+    from saha.commands.plugin import sync_claude_artifacts
+    from saha.orchestrator.factory import create_orchestrator
+    from saha.orchestrator.loop import LoopConfig
+    from saha.verification import cleanup_template_artifacts
+
     setup_logging(verbose)
 
     # Sync Claude artifacts (agents, etc.) before execution
@@ -244,7 +330,7 @@ def _run_command(
         )
         return
 
-    enabled_tools = tools.split(",") if tools else None
+    enabled_tools = _parse_tools(tools)
 
     # Run verification unless explicitly skipped or dry-run
     if not skip_verify and not dry_run:
@@ -303,40 +389,41 @@ def _build_run_settings(
     default_runner: str | None,
     dangerously_skip_permissions: bool,
 ) -> Settings:
-    """Build settings with CLI overrides."""
-    settings = Settings(dry_run=dry_run, verbose=verbose)
+    """Build settings with CLI overrides.
+
+    Overrides are collected first and applied with one model_copy per level,
+    so each agent config is copied at most once however many flags touch it.
+    model_copy skips validation and records updated fields in model_fields_set,
+    which the runner registry relies on to tell explicit runners from defaults.
+    """
+    from saha.config.settings import get_settings
+
+    settings = get_settings()
+
+    settings_updates: dict[str, Any] = {"dry_run": dry_run, "verbose": verbose}
+    agents_updates: dict[str, Any] = {}
+    agent_runners: dict[str, str] = {}
 
     if default_runner:
-        agent_updates = {
-            "implementer": settings.agents.implementer.model_copy(
-                update={"runner": default_runner}
-            ),
-            "qa": settings.agents.qa.model_copy(update={"runner": default_runner}),
-            "code_quality": settings.agents.code_quality.model_copy(
-                update={"runner": default_runner}
-            ),
-            "manager": settings.agents.manager.model_copy(update={"runner": default_runner}),
-            "dod": settings.agents.dod.model_copy(update={"runner": default_runner}),
-        }
-        updated_agents = settings.agents.model_copy(
-            update={"default_runner": default_runner, **agent_updates}
-        )
-        settings = settings.model_copy(update={"agents": updated_agents, "runner": default_runner})
+        agent_runners = dict.fromkeys(_EXECUTION_AGENT_FIELDS, default_runner)
+        agents_updates["default_runner"] = default_runner
+        settings_updates["runner"] = default_runner
 
     if qa_runner:
-        updated_qa = settings.agents.qa.model_copy(update={"runner": qa_runner})
-        updated_agents = settings.agents.model_copy(update={"qa": updated_qa})
-        settings = settings.model_copy(update={"agents": updated_agents})
+        agent_runners["qa"] = qa_runner
 
     if dangerously_skip_permissions:
-        settings = settings.model_copy(
-            update={
-                "claude_dangerously_skip_permissions": True,
-                "codex_dangerously_bypass_sandbox": True,
-            }
-        )
+        settings_updates["claude_dangerously_skip_permissions"] = True
+        settings_updates["codex_dangerously_bypass_sandbox"] = True
+
+    for field_name, runner in agent_runners.items():
+        agent_config = getattr(settings.agents, field_name)
+        agents_updates[field_name] = agent_config.model_copy(update={"runner": runner})
+
+    if agents_updates:
+        settings_updates["agents"] = settings.agents.model_copy(update=agents_updates)
 
-    return settings
+    return settings.model_copy(update=settings_updates)
 
 
 def _resolve_and_validate_task_path(
@@ -344,9 +431,11 @@ def _resolve_and_validate_task_path(
 ) -> Path:
     """Resolve and validate the task path."""
     resolved_path = task_path or settings.get_task_path(task_id)
-    if not resolved_path.exists():
+    try:
+        os.stat(resolved_path)
+    except OSError:
         typer.echo(f"Error: Task path does not exist: {resolved_path}", err=True)
-        raise typer.Exit(1)
+        raise typer.Exit(1) from None
     return resolved_path
 
 
@@ -359,6 +448,8 @@ def _display_run_info(task_id: str, task_path: Path, max_iterations: int) -> Non
 
 def _display_run_result(state: ExecutionState) -> None:
     """Display run command result."""
+    from saha.models.state import LoopPhase
+
     typer.echo(f"\nLoop finished. Final phase: {state.current_phase.value}")
     typer.echo(f"Iterations completed: {state.current_iteration}")
     if state.current_phase == LoopPhase.STOPPED and state.error_message:
@@ -367,6 +458,8 @@ def _display_run_result(state: ExecutionState) -> None:
 
 def _run_verification(task_id: str, task_path: Path) -> VerificationResult:
     """Run verification checks and display results."""
+    from saha.verification import TaskVerifier
+
     typer.echo("Verifying task artifacts...")
 
     verifier = TaskVerifier(task_path)
@@ -378,32 +471,30 @@ def _run_verification(task_id: str, task_path: Path) -> VerificationResult:
 
 def _display_verification_result(result: VerificationResult) -> None:
     """Display verification result with colored status indicators."""
-    status_symbols = {
-        VerificationStatus.PASSED: typer.style("PASSED", fg=typer.colors.GREEN, bold=True),
-        VerificationStatus.WARNINGS: typer.style("WARNINGS", fg=typer.colors.YELLOW, bold=True),
-        VerificationStatus.FAILED: typer.style("FAILED", fg=typer.colors.RED, bold=True),
-    }
-
-    typer.echo(f"\nVerification: {status_symbols[result.status]}")
-    typer.echo("")
+    lines = [f"\nVerification: {_STATUS_SYMBOLS[result.status.value]}", ""]
 
     for check in result.checks:
         if check.passed:
-            symbol = typer.style("[ok]", fg=typer.colors.GREEN)
+            template = _CHECK_OK_LINE
         elif check.is_warning:
-            symbol = typer.style("[warn]", fg=typer.colors.YELLOW)
+            template = _CHECK_WARN_LINE
         else:
-            symbol = typer.style("[fail]", fg=typer.colors.RED)
-        typer.echo(f"  {symbol} {check.name}: {check.message}")
+            template = _CHECK_FAIL_LINE
+        lines.append(template % (check.name, check.message))
 
-    typer.echo("")
+    lines.append("")
+    # One write for the whole report instead of one echo per check
+    typer.echo("\n".join(lines))
 
 
 def _resume_command(task_id: str, verbose: bool) -> None:
     """Implementation of the resume command logic."""
+    from saha.config.settings import get_settings
+    from saha.orchestrator.factory import create_orchestrator
+
     setup_logging(verbose)
 
-    settings = Settings(verbose=verbose)
+    settings = get_settings().model_copy(update={"verbose": verbose})
     orchestrator = create_orchestrator(settings)
 
     typer.echo(f"Resuming task: {task_id}")
@@ -418,7 +509,10 @@ def _resume_command(task_id: str, verbose: bool) -> None:
 
 def _status_command(task_id: str | None, verbose: bool) -> None:
     """Implementation of the status command logic."""
-    settings = Settings()
+    from saha.config.settings import get_settings
+    from saha.orchestrator.state import StateManager
+
+    settings = get_settings()
     state_manager = StateManager(settings.state_dir)
 
     if task_id:
@@ -429,6 +523,8 @@ def _status_command(task_id: str | None, verbose: bool) -> None:
 
 def _show_single_task_status(state_manager: StateManager, task_id: str, verbose: bool) -> None:
     """Display status for a single task."""
+    from saha.models.state import LoopPhase
+
     state = state_manager.load(task_id)
     if state is None:
         typer.echo(f"No saved state for task: {task_id}")
@@ -452,37 +548,41 @@ def _show_single_task_status(state_manager: StateManager, task_id: str, verbose:
 
 def _list_all_task_statuses(state_manager: StateManager) -> None:
     """List status of all tasks with saved state."""
+    from saha.models.state import LoopPhase
+
     task_ids = state_manager.list_tasks()
     if not task_ids:
         typer.echo("No tasks with saved execution state.")
         return
 
-    typer.echo("Tasks with saved state:")
-    for tid in task_ids:
-        state = state_manager.load(tid)
+    lines = ["Tasks with saved state:"]
+    for tid, state in zip(task_ids, state_manager.load_many(task_ids), strict=True):
         if state:
             status_line = f"  {tid}: {state.current_phase.value}"
             if state.current_phase == LoopPhase.SCHEDULED and state.scheduled_at:
                 status_line += f" at {state.scheduled_at.strftime('%Y-%m-%d %H:%M:%S')}"
             status_line += f" (iter {state.current_iteration})"
-            typer.echo(status_line)
+            lines.append(status_line)
+    typer.echo("\n".join(lines))
 
 
 def _tools_command() -> None:
     """Implementation of the tools command logic."""
-    registry = create_default_registry()
+    registry = _default_tool_registry()
+    tools = [tool for name in registry.list_all() if (tool := registry.get(name))]
 
-    typer.echo("Registered tools:")
-    for name in registry.list_all():
-        tool = registry.get(name)
-        if tool:
-            available = "✓" if tool.is_available() else "✗"
-            typer.echo(f"  {available} {name}")
+    lines = ["Registered tools:"]
+    for tool, available in zip(tools, _tool_availability(tools), strict=True):
+        lines.append(f"  {'✓' if available else '✗'} {tool.name}")
+    typer.echo("\n".join(lines))
 
 
 def _clean_command(task_id: str | None, all_tasks: bool) -> None:
     """Implementation of the clean command logic."""
-    settings = Settings()
+    from saha.config.settings import get_settings
+    from saha.orchestrator.state import StateManager
+
+    settings = get_settings()
     state_manager = StateManager(settings.state_dir)
 
     if all_tasks:
@@ -496,10 +596,10 @@ def _clean_command(task_id: str | None, all_tasks: bool) -> None:
 def _clean_all_tasks(state_manager: StateManager) -> None:
     """Clean all task states."""
     task_ids = state_manager.list_tasks()
-    for tid in task_ids:
-        state_manager.delete(tid)
-        typer.echo(f"Cleaned: {tid}")
-    typer.echo(f"Cleaned {len(task_ids)} task(s).")
+    state_manager.delete_many(task_ids)
+    lines = [f"Cleaned: {tid}" for tid in task_ids]
+    lines.append(f"Cleaned {len(task_ids)} task(s).")
+    typer.echo("\n".join(lines))
 
 
 def _clean_single_task(state_manager: StateManager, task_id: str) -> None:
@@ -517,6 +617,8 @@ def _version_command() -> None:
 
 def _use_command(task_id: str | None, clear: bool) -> None:
     """Implementation of the use command logic."""
+    from saha.context import clear_current_task, get_current_task, set_current_task
+
     if clear:
         if clear_current_task():
             typer.echo("Cleared current task context.")
@@ -544,11 +646,52 @@ def _use_command(task_id: str | None, clear: bool) -> None:
 # Command registration (minimal - just wires CLI to implementations)
 # -----------------------------------------------------------------------------
 
+# Help text for commands with long descriptions, kept out of docstrings so
+# Typer uses it verbatim instead of re-deriving it from each callback
+_RUN_HELP = """\
+Run the agentic loop for a task.
+
+If no task ID is provided, uses the current task set via 'saha use'.
+
+Before execution, verifies that task artifacts are complete:
+- task-description.md exists
+- At least 1 user story
+- At least 1 test spec
+- At least 1 implementation phase
+
+Warnings will block execution by default. You can confirm at the prompt to proceed.
+Use --skip-verify to bypass verification entirely and run anyway.
+
+The loop executes these phases in order:
+1. Implementation - writes code changes
+2. QA - verifies against Definition of Done (optionally with Playwright)
+3. Code Quality - runs ruff, ty, complexity checks
+4. Manager - updates task artifacts
+5. DoD Check - determines if task is complete
+
+Different agents can use different LLM backends. Use --runner to switch
+all execution agents (e.g., Codex), or --qa-runner for per-agent overrides.
+"""
+
+_RESUME_HELP = """\
+Resume a previously started task.
+
+If no task ID is provided, uses the current task set via 'saha use'.
+"""
+
+_USE_HELP = """\
+Set, show, or clear the current task context.
+
+With no arguments, shows the current task.
+With a task ID, sets it as the active task.
+With --clear, removes the current task context.
+"""
+
 
 def register_execution_commands(app: typer.Typer) -> None:
     """Register all execution-related commands with the Typer app."""
 
-    @app.command()
+    @app.command(help=_RUN_HELP)
     def run(
         task_id: Annotated[
             str | None,
@@ -617,29 +760,8 @@ def register_execution_commands(app: typer.Typer) -> None:
             typer.Option("--at", help="Schedule execution at specific time (e.g., 14:00)"),
         ] = None,
     ) -> None:
-        """Run the agentic loop for a task.
-
-        If no task ID is provided, uses the current task set via 'saha use'.
-
-        Before execution, verifies that task artifacts are complete:
-        - task-description.md exists
-        - At least 1 user story
-        - At least 1 test spec
-        - At least 1 implementation phase
-
-        Warnings will block execution by default. You can confirm at the prompt to proceed.
-        Use --skip-verify to bypass verification entirely and run anyway.
+        from saha.context import resolve_task_id
 
-        The loop executes these phases in order:
-        1. Implementation - writes code changes
-        2. QA - verifies against Definition of Done (optionally with Playwright)
-        3. Code Quality - runs ruff, ty, complexity checks
-        4. Manager - updates task artifacts
-        5. DoD Check - determines if task is complete
-
-        Different agents can use different LLM backends. Use --runner to switch
-        all execution agents (e.g., Codex), or --qa-runner for per-agent overrides.
-        """
         try:
             resolved_id = resolve_task_id(task_id)
         except ValueError as e:
@@ -661,7 +783,7 @@ def register_execution_commands(app: typer.Typer) -> None:
             at,
         )
 
-    @app.command()
+    @app.command(help=_RESUME_HELP)
     def resume(
         task_id: Annotated[
             str | None,
@@ -675,10 +797,8 @@ def register_execution_commands(app: typer.Typer) -> None:
             typer.Option("--verbose", "-v", help="Enable verbose output"),
         ] = False,
     ) -> None:
-        """Resume a previously started task.
+        from saha.context import resolve_task_id
 
-        If no task ID is provided, uses the current task set via 'saha use'.
-        """
         try:
             resolved_id = resolve_task_id(task_id)
         except ValueError as e:
@@ -719,7 +839,7 @@ def register_execution_commands(app: typer.Typer) -> None:
         """Clean execution state files."""
         _clean_command(task_id, all_tasks)
 
-    @app.command()
+    @app.command(help=_USE_HELP)
     def use(
         task_id: Annotated[
             str | None,
@@ -732,12 +852,6 @@ def register_execution_commands(app: typer.Typer) -> None:
             typer.Option("--clear", help="Clear the current task context"),
         ] = False,
     ) -> None:
-        """Set, show, or clear the current task context.
-
-        With no arguments, shows the current task.
-        With a task ID, sets it as the active task.
-        With --clear, removes the current task context.
-        """
         _use_command(task_id, clear)
 
     @app.command()
@@ -6,50 +6,70 @@ This module contains commands for:
 - claude/codex/gemini: Launch CLI with Sahaidachny artifacts configured
 """
 
-import filecmp
+import functools
+import hashlib
+import importlib.util
 import logging
+import operator
+import os
 import shutil
+import stat
 import subprocess
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Annotated, Literal
 
 import typer
-from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def _find_plugin_path() -> Path | None:
-    """Find the plugin directory in various locations."""
-    # First, try to import the plugin package (works when installed)
-    try:
-        import claude_plugin
+    """Find the plugin directory in various locations.
 
-        plugin_path = claude_plugin.get_plugin_path()
-        if plugin_path.exists() and (plugin_path / "commands").exists():
+    The lookup is cached for the life of the process; every command resolves
+    the same plugin.
+    """
+    # First, locate the installed plugin package. find_spec gives its directory
+    # (what claude_plugin.get_plugin_path() returns) without executing the package.
+    try:
+        spec = importlib.util.find_spec("claude_plugin")
+    except (ImportError, ValueError):
+        spec = None
+    if spec is not None and spec.submodule_search_locations:
+        plugin_path = Path(next(iter(spec.submodule_search_locations)))
+        if (plugin_path / "commands").exists():
             return plugin_path
-    except ImportError:
-        pass
 
     # Fallback: search in common locations
-    candidates = [
+    candidates = (
         # Current working directory (for development)
         Path.cwd() / "claude_plugin",
         # Relative to package (for editable installs)
         Path(__file__).parent.parent.parent / "claude_plugin",
         # User data directory fallback
         Path.home() / ".local" / "share" / "sahaidachny" / "claude_plugin",
-    ]
+    )
 
     for candidate in candidates:
-        if candidate.exists() and (candidate / "commands").exists():
+        # A missing candidate has no commands/ either, so one stat answers both
+        if (candidate / "commands").exists():
             return candidate
 
     return None
 
 
-class SyncResult(BaseModel):
+def reset_plugin_path_cache() -> None:
+    """Forget the cached plugin location so the next lookup probes again."""
+    _find_plugin_path.cache_clear()
+
+
+@dataclass(slots=True, frozen=True)
+class SyncResult:
     """Result of syncing Claude artifacts."""
 
     agents_synced: list[str]
@@ -57,7 +77,8 @@ class SyncResult(BaseModel):
     plugin_path: str | None
 
 
-class TargetSyncResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TargetSyncResult:
     """Result of syncing artifacts for one CLI target."""
 
     target: Literal["claude", "codex", "gemini"]
@@ -66,7 +87,8 @@ class TargetSyncResult(BaseModel):
     total_synced: int
 
 
-class MultiSyncResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MultiSyncResult:
     """Result of syncing artifacts across one or more CLI targets."""
 
     plugin_path: str | None
@@ -89,141 +111,310 @@ CLI_INSTALL_HINTS: dict[str, str] = {
 
 
 # Required execution agents that must exist for the loop to run
-REQUIRED_EXECUTION_AGENTS = [
-    "execution-implementer.md",
-    "execution-qa.md",
-    "execution-code-quality.md",
-    "execution-dod.md",
-    "execution-manager.md",
-    "execution-test-critique.md",
-]
+REQUIRED_EXECUTION_AGENTS = frozenset(
+    {
+        "execution-implementer.md",
+        "execution-qa.md",
+        "execution-code-quality.md",
+        "execution-dod.md",
+        "execution-manager.md",
+        "execution-test-critique.md",
+    }
+)
 
 # Optional agent variants
-OPTIONAL_EXECUTION_AGENTS = [
-    "execution-qa-playwright.md",
-]
+OPTIONAL_EXECUTION_AGENTS = frozenset({"execution-qa-playwright.md"})
+
+# Every agent file sync_claude_artifacts keeps in sync
+_ALL_EXECUTION_AGENTS = REQUIRED_EXECUTION_AGENTS | OPTIONAL_EXECUTION_AGENTS
+
+
+# Content digests of plugin source files keyed by path: (size, mtime_ns, digest)
+_SOURCE_DIGESTS: dict[Path, tuple[int, int, bytes]] = {}
+
+
+def _file_digest(path: Path) -> bytes:
+    """Hash file contents with BLAKE2b."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+
 
+def _source_digest(source: Path, source_stat: os.stat_result) -> bytes:
+    """Hash a plugin source file, reusing the digest while size and mtime are unchanged."""
+    cached = _SOURCE_DIGESTS.get(source)
+    if cached is not None and cached[:2] == (source_stat.st_size, source_stat.st_mtime_ns):
+        return cached[2]
 
-def _should_copy_file(source: Path, target: Path, force: bool) -> bool:
-    """Return True when a file should be copied from source to target."""
-    if not target.exists():
+    digest = _file_digest(source)
+    _SOURCE_DIGESTS[source] = (source_stat.st_size, source_stat.st_mtime_ns, digest)
+    return digest
+
+
+def _should_copy_file(
+    source: Path, target: Path, force: bool, source_stat: os.stat_result | None = None
+) -> bool:
+    """Return True when a file should be copied from source to target.
+
+    With force, size and mtime are compared first; contents are only hashed
+    when sizes match but mtimes differ.
+    """
+    try:
+        target_stat = os.lstat(target)
+    except OSError:
         return True
 
-    if target.is_symlink():
+    if stat.S_ISLNK(target_stat.st_mode):
         return True
 
     if not force:
         return False
 
     try:
-        return not filecmp.cmp(source, target, shallow=False)
+        source_stat = source_stat or os.stat(source)
+        if source_stat.st_size != target_stat.st_size:
+            return True
+        if source_stat.st_mtime_ns == target_stat.st_mtime_ns:
+            return False
+        return _source_digest(source, source_stat) != _file_digest(target)
     except OSError:
         return True
 
 
-def _sync_file(source: Path, target: Path, force: bool) -> bool:
-    """Sync one file, optionally overwriting changed destinations."""
-    if not source.exists() or not source.is_file():
+# copy_file_range lets the kernel share extents on reflink-capable filesystems
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+
+def _copy_file_range(src: str, dst: str, size: int) -> bool:
+    """Copy src to dst with os.copy_file_range. Returns False if unsupported."""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            return remaining == 0
+    except OSError:
+        # EXDEV/ENOSYS/EOPNOTSUPP and friends: let shutil pick sendfile or read/write
         return False
 
-    target.parent.mkdir(parents=True, exist_ok=True)
-    if not _should_copy_file(source, target, force):
+
+def _fast_copy(src: str, dst: str, src_stat: os.stat_result) -> None:
+    """Copy a regular file's contents, executable bits and mtime to dst."""
+    if not (_HAS_COPY_FILE_RANGE and _copy_file_range(src, dst, src_stat.st_size)):
+        shutil.copyfile(src, dst)
+    if src_stat.st_mode & 0o111:
+        # Scripts need their executable bits, which a plain copy does not carry over
+        os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    # The mtime lets the next forced sync skip unchanged files
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def _sync_file(
+    source: Path | os.DirEntry[str], target: Path, force: bool, make_parent: bool = True
+) -> bool:
+    """Sync one file, optionally overwriting changed destinations.
+
+    source may be a scanned DirEntry, whose cached stat is then shared by
+    every target the same scan is synced into. Pass make_parent=False when
+    the caller has already created the target's parent directory.
+    """
+    try:
+        if isinstance(source, os.DirEntry):
+            source_stat = source.stat()
+            source = Path(source.path)
+        else:
+            source_stat = os.stat(source)
+    except OSError:
+        return False
+    if not stat.S_ISREG(source_stat.st_mode):
+        return False
+
+    if make_parent:
+        target.parent.mkdir(parents=True, exist_ok=True)
+    if not _should_copy_file(source, target, force, source_stat):
         return False
 
     if target.is_symlink():
         target.unlink()
 
-    shutil.copy2(source, target)
+    _fast_copy(os.fspath(source), os.fspath(target), source_stat)
     return True
 
 
-def _sync_directory_tree(source_dir: Path, target_dir: Path, force: bool, prefix: str) -> list[str]:
-    """Sync all files from source_dir into target_dir and return synced relative paths."""
-    if not source_dir.exists() or not source_dir.is_dir():
-        return []
+# Directory trees with at least this many files are copied on a thread pool
+_PARALLEL_COPY_THRESHOLD = 4
+_MAX_COPY_WORKERS = 8
 
-    synced: list[str] = []
-    for source in source_dir.rglob("*"):
-        if not source.is_file():
-            continue
 
-        rel_path = source.relative_to(source_dir)
-        target = target_dir / rel_path
-        if _sync_file(source, target, force):
-            synced.append(f"{prefix}/{rel_path.as_posix()}")
+def _sync_directory_tree(
+    files: list[tuple[str, os.DirEntry[str]]], target_dir: Path, force: bool, prefix: str
+) -> list[str]:
+    """Sync scanned (relative path, entry) files into target_dir and return synced paths."""
 
-    return synced
+    def sync_one(file: tuple[str, os.DirEntry[str]]) -> bool:
+        rel_path, entry = file
+        return _sync_file(entry, target_dir / rel_path, force, make_parent=False)
+
+    if len(files) < _PARALLEL_COPY_THRESHOLD:
+        copied = [sync_one(file) for file in files]
+    else:
+        workers = min(_MAX_COPY_WORKERS, len(files), (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            copied = list(executor.map(sync_one, files))
+
+    return [
+        f"{prefix}/{rel_path}"
+        for (rel_path, _), was_copied in zip(files, copied, strict=True)
+        if was_copied
+    ]
 
 
 def _sync_commands_directory(
-    source_dir: Path,
+    commands: list[tuple[str, os.DirEntry[str]]],
     target_dir: Path,
     target_cli: Literal["claude", "codex", "gemini"],
     force: bool,
 ) -> list[str]:
     """Sync command markdown files for a specific CLI target."""
-    if not source_dir.exists() or not source_dir.is_dir():
-        return []
+    existing: dict[str, os.DirEntry[str]] = {}
+    if target_cli == "claude":
+        # One listing up front serves every legacy-link lookup below
+        try:
+            with os.scandir(target_dir) as it:
+                existing = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            pass
 
     synced: list[str] = []
-    for source in source_dir.iterdir():
-        if source.suffix != ".md":
-            continue
-
+    for source_name, entry in commands:
         target_name = (
-            _get_command_target_name(source.name) if target_cli == "claude" else source.name
+            _get_command_target_name(source_name) if target_cli == "claude" else source_name
         )
         destination = target_dir / target_name
-        if _sync_file(source, destination, force):
+        if _sync_file(entry, destination, force, make_parent=False):
             synced.append(f"commands/{target_name}")
 
         if target_cli == "claude":
-            _cleanup_legacy_claude_command_links(target_dir, source.name, destination)
+            _cleanup_legacy_claude_command_links(existing, source_name, target_name)
 
-    return sorted(synced)
+    return synced
 
 
 def _cleanup_legacy_claude_command_links(
-    commands_dir: Path, source_name: str, namespaced_target: Path
+    existing: dict[str, os.DirEntry[str]], source_name: str, target_name: str
 ) -> None:
-    """Clean up stale legacy command links/files for Claude command namespace migration."""
-    unprefixed_path = commands_dir / source_name
-    if unprefixed_path.is_symlink():
-        unprefixed_path.unlink()
+    """Clean up stale legacy command links/files for Claude command namespace migration.
 
-    if source_name == "saha.md":
-        old_prefixed = commands_dir / "sahaidachny.md"
-    else:
-        old_prefixed = commands_dir / f"sahaidachny:{source_name}"
+    existing is the commands directory listing taken before this sync, so the
+    freshly synced target_name itself is never removed.
+    """
+    unprefixed = existing.get(source_name)
+    if unprefixed is not None and source_name != target_name and unprefixed.is_symlink():
+        os.unlink(unprefixed.path)
+
+    legacy_name = _get_legacy_command_name(source_name)
+    legacy = existing.get(legacy_name)
+    if legacy is not None and legacy_name != target_name:
+        os.unlink(legacy.path)
 
-    if old_prefixed.exists() and old_prefixed != namespaced_target:
-        old_prefixed.unlink()
+
+# Plugin directories synced recursively, file for file
+_ARTIFACT_TREE_DIRS = ("agents", "skills", "templates", "scripts")
+
+
+def _iter_plugin_artifacts(plugin_path: Path) -> Iterator[tuple[str, str, os.DirEntry[str]]]:
+    """Walk the plugin once, yielding (category, relative path, entry) per syncable file.
+
+    category is "commands" (top-level *.md only), one of _ARTIFACT_TREE_DIRS,
+    or "settings" for settings.json. DirEntry type checks reuse readdir data.
+    """
+    try:
+        with os.scandir(plugin_path) as it:
+            top_entries = list(it)
+    except OSError:
+        return
+
+    for top in top_entries:
+        if top.name == "settings.json":
+            if top.is_file():
+                yield "settings", top.name, top
+        elif top.name == "commands":
+            if top.is_dir():
+                with os.scandir(top.path) as it:
+                    commands = [
+                        e for e in it if os.path.splitext(e.name)[1] == ".md" and e.is_file()
+                    ]
+                for entry in commands:
+                    yield "commands", entry.name, entry
+        elif top.name in _ARTIFACT_TREE_DIRS and top.is_dir():
+            stack = [(top.path, "")]
+            while stack:
+                dir_path, rel_dir = stack.pop()
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{rel_dir}{entry.name}/"))
+                    elif entry.is_file():
+                        yield top.name, f"{rel_dir}{entry.name}", entry
+
+
+@dataclass(slots=True)
+class _PluginScan:
+    """Plugin artifacts grouped by category, scanned once and shared between targets."""
+
+    files: dict[str, list[tuple[str, os.DirEntry[str]]]]
+    # Destination-relative directories that must exist before copying ("" is the root)
+    parent_dirs: list[str]
+
+    @classmethod
+    def of(cls, plugin_path: Path) -> "_PluginScan":
+        """Scan plugin_path and group its artifacts by category."""
+        files: dict[str, list[tuple[str, os.DirEntry[str]]]] = {}
+        parent_dirs: set[str] = set()
+        for category, rel_path, entry in _iter_plugin_artifacts(plugin_path):
+            files.setdefault(category, []).append((rel_path, entry))
+            if category == "settings":
+                parent_dirs.add("")
+            else:
+                parent_dirs.add(os.path.dirname(f"{category}/{rel_path}"))
+        return cls(files, sorted(parent_dirs))
+
+    def get(self, category: str) -> list[tuple[str, os.DirEntry[str]]]:
+        """Get the (relative path, entry) pairs of one category."""
+        return self.files.get(category, [])
 
 
 def _sync_target_artifacts(
-    plugin_path: Path,
+    scan: _PluginScan,
     base_dir: Path,
     target: Literal["claude", "codex", "gemini"],
     force: bool,
 ) -> TargetSyncResult:
-    """Sync all plugin artifacts for one target CLI directory."""
+    """Sync scanned plugin artifacts for one target CLI directory."""
     destination = base_dir / CLI_TARGET_DIRS[target]
     destination.mkdir(parents=True, exist_ok=True)
+    # Create each destination directory once rather than once per copied file
+    for parent_dir in scan.parent_dirs:
+        (destination / parent_dir).mkdir(parents=True, exist_ok=True)
 
     synced: list[str] = []
     synced.extend(
-        _sync_commands_directory(plugin_path / "commands", destination / "commands", target, force)
+        _sync_commands_directory(scan.get("commands"), destination / "commands", target, force)
     )
 
-    for directory in ("agents", "skills", "templates", "scripts"):
+    for directory in _ARTIFACT_TREE_DIRS:
         synced.extend(
             _sync_directory_tree(
-                plugin_path / directory, destination / directory, force=force, prefix=directory
+                scan.get(directory), destination / directory, force=force, prefix=directory
             )
         )
 
-    if _sync_file(plugin_path / "settings.json", destination / "settings.json", force):
-        synced.append("settings.json")
+    for _, entry in scan.get("settings"):
+        if _sync_file(entry, destination / "settings.json", force, make_parent=False):
+            synced.append("settings.json")
 
     return TargetSyncResult(
         target=target,
@@ -262,10 +453,21 @@ def sync_artifacts(
     else:
         targets = [target]
 
-    results = [
-        _sync_target_artifacts(resolved_plugin, resolved_base, cli_target, force)
-        for cli_target in targets
-    ]
+    # Scan the plugin once and share the listing between targets
+    scan = _PluginScan.of(resolved_plugin)
+    if len(targets) == 1:
+        results = [_sync_target_artifacts(scan, resolved_base, targets[0], force)]
+    else:
+        # Targets write to independent directories, so their file I/O can overlap
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            results = list(
+                executor.map(
+                    lambda cli_target: _sync_target_artifacts(
+                        scan, resolved_base, cli_target, force
+                    ),
+                    targets,
+                )
+            )
     total_synced = sum(result.total_synced for result in results)
 
     return MultiSyncResult(
@@ -275,6 +477,61 @@ def sync_artifacts(
     )
 
 
+def _agent_sync_stamp_path(agents_dir: Path) -> Path:
+    """Get the cache file holding the last agent sync fingerprint for a project."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    key = hashlib.blake2b(os.fsencode(agents_dir.resolve()), digest_size=8).hexdigest()
+    return Path(cache_home) / "saha" / f"plugin_sync-{key}.hash"
+
+
+def _scan_execution_agents(directory: Path) -> dict[str, os.DirEntry[str]]:
+    """Snapshot the execution agent entries of a directory in one read."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries if entry.name in _ALL_EXECUTION_AGENTS}
+    except OSError:
+        return {}
+
+
+def _agent_sync_fingerprint(
+    plugin_agents: dict[str, os.DirEntry[str]], project_agents: dict[str, os.DirEntry[str]]
+) -> str:
+    """Fingerprint the agent files sync_claude_artifacts reads and writes.
+
+    Covers (size, mtime_ns, mode) of every execution agent on both sides, so
+    an edited plugin agent or a locally modified/removed copy forces a sync.
+    Agents absent from a snapshot are recorded as missing without a stat.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    # Sorted: set iteration order varies between processes
+    for agent_name in sorted(_ALL_EXECUTION_AGENTS):
+        for snapshot in (plugin_agents, project_agents):
+            try:
+                st = snapshot[agent_name].stat(follow_symlinks=False)
+            except (KeyError, OSError):
+                digest.update(b"missing\0")
+                continue
+            digest.update(f"{st.st_size}:{st.st_mtime_ns}:{st.st_mode}\0".encode())
+    return digest.hexdigest()
+
+
+def _agents_in_sync(stamp_path: Path, fingerprint: str) -> bool:
+    """Check whether the last recorded sync fingerprint matches."""
+    try:
+        return stamp_path.read_text() == fingerprint
+    except OSError:
+        return False
+
+
+def _record_agent_sync(stamp_path: Path, fingerprint: str) -> None:
+    """Record the sync fingerprint; failures only cost a re-check next run."""
+    try:
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        stamp_path.write_text(fingerprint)
+    except OSError as e:
+        logger.debug(f"Could not record agent sync fingerprint: {e}")
+
+
 def sync_claude_artifacts(claude_dir: Path | None = None) -> SyncResult:
     """Ensure all required Claude artifacts exist in the project.
 
@@ -303,17 +560,28 @@ def sync_claude_artifacts(claude_dir: Path | None = None) -> SyncResult:
         logger.warning(f"Plugin agents directory not found: {plugin_agents}")
         return SyncResult(agents_synced=[], total_synced=0, plugin_path=str(plugin_path))
 
-    synced: list[str] = []
+    # One directory read per side tells which execution agents exist where
+    shipped = _scan_execution_agents(plugin_agents)
+    installed = _scan_execution_agents(agents_dir)
+
+    # Skip the per-file content comparison when nothing changed since the last sync
+    stamp_path = _agent_sync_stamp_path(agents_dir)
+    if _agents_in_sync(stamp_path, _agent_sync_fingerprint(shipped, installed)):
+        return SyncResult(agents_synced=[], total_synced=0, plugin_path=str(plugin_path))
 
-    # Sync required agents
-    for agent_name in REQUIRED_EXECUTION_AGENTS + OPTIONAL_EXECUTION_AGENTS:
-        target = agents_dir / agent_name
-        source = plugin_agents / agent_name
+    synced: list[str] = []
 
-        if source.exists() and _sync_file(source, target, force=True):
+    for agent_name in sorted(shipped):
+        # Installed copies are still compared: the plugin may ship a newer version
+        if _sync_file(shipped[agent_name], agents_dir / agent_name, force=True, make_parent=False):
             synced.append(agent_name)
             logger.info(f"Synced agent: {agent_name}")
 
+    # Re-scan the project side: DirEntry stats are cached from before the copies
+    _record_agent_sync(
+        stamp_path, _agent_sync_fingerprint(shipped, _scan_execution_agents(agents_dir))
+    )
+
     return SyncResult(
         agents_synced=synced,
         total_synced=len(synced),
@@ -325,15 +593,20 @@ def _show_plugin_contents(plugin_path: Path) -> None:
     """Display plugin directory contents."""
     typer.echo(f"Plugin location: {plugin_path}")
     typer.echo("\nContents:")
-    for item in sorted(plugin_path.iterdir()):
-        if item.is_dir():
-            count = len(list(item.iterdir()))
-            typer.echo(f"  {item.name}/ ({count} files)")
+    with os.scandir(plugin_path) as it:
+        # Sort on the plain name strings, not on Path objects
+        entries = sorted(it, key=operator.attrgetter("name"))
+    for entry in entries:
+        if entry.is_dir():
+            with os.scandir(entry.path) as children:
+                count = sum(1 for _ in children)
+            typer.echo(f"  {entry.name}/ ({count} files)")
         else:
-            typer.echo(f"  {item.name}")
+            typer.echo(f"  {entry.name}")
     typer.echo("\nTo copy plugin: saha plugin --copy-to <target-dir>")
 
 
+@functools.cache
 def _get_command_target_name(item_name: str) -> str:
     """Get target filename for command, adding saha: prefix as needed."""
     # Main help command stays as-is (no prefix)
@@ -342,146 +615,180 @@ def _get_command_target_name(item_name: str) -> str:
     return f"saha:{item_name}"
 
 
-def _copy_plugin_commands(src_dir: Path, dst_dir: Path) -> int:
+@functools.cache
+def _get_legacy_command_name(item_name: str) -> str:
+    """Get the pre-migration sahaidachny: filename for a command."""
+    if item_name == "saha.md":
+        return "sahaidachny.md"
+    return f"sahaidachny:{item_name}"
+
+
+def _copy_plugin_commands(src_dir: str, dst_dir: str) -> int:
     """Copy command files with namespace prefix. Returns count of files copied."""
-    if not src_dir.exists():
+    if not os.path.exists(src_dir):
         return 0
 
-    dst_dir.mkdir(exist_ok=True)
+    os.makedirs(dst_dir, exist_ok=True)
     copied = 0
 
-    for item in src_dir.iterdir():
-        if item.suffix == ".md":
-            target_name = _get_command_target_name(item.name)
-            item_dst = dst_dir / target_name
-            if not item_dst.exists():
-                shutil.copy2(item, item_dst)
-                copied += 1
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".md"):
+                item_dst = os.path.join(dst_dir, _get_command_target_name(entry.name))
+                if not os.path.lexists(item_dst):
+                    _fast_copy(entry.path, item_dst, entry.stat())
+                    copied += 1
 
     return copied
 
 
-def _copy_single_item(src_item: Path, dst_item: Path) -> bool:
+def _fast_copytree(src: str, dst: str) -> None:
+    """Copy a directory tree, reusing each scanned entry's stat for the copy."""
+    pending = [(src, dst)]
+    while pending:
+        src_dir, dst_dir = pending.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                # Symlinks are followed, as shutil.copytree does by default
+                if entry.is_dir():
+                    pending.append((entry.path, target))
+                else:
+                    _fast_copy(entry.path, target, entry.stat())
+
+
+def _copy_single_item(src_item: os.DirEntry[str], dst_item: str) -> bool:
     """Copy a single file or directory. Returns True if copied."""
-    if dst_item.exists():
+    if os.path.lexists(dst_item):
         return False
 
     if src_item.is_dir():
-        shutil.copytree(src_item, dst_item)
+        _fast_copytree(src_item.path, dst_item)
     else:
-        shutil.copy2(src_item, dst_item)
+        _fast_copy(src_item.path, dst_item, src_item.stat())
     return True
 
 
-def _copy_directory_contents(src: Path, dst: Path) -> int:
+def _copy_directory_contents(src: str, dst: str) -> int:
     """Copy contents of a directory. Returns count of items copied."""
-    if not src.exists():
+    if not os.path.exists(src):
         return 0
 
-    dst.mkdir(exist_ok=True)
+    os.makedirs(dst, exist_ok=True)
     copied = 0
-    for item in src.iterdir():
-        if _copy_single_item(item, dst / item.name):
-            copied += 1
+    with os.scandir(src) as it:
+        for entry in it:
+            if _copy_single_item(entry, os.path.join(dst, entry.name)):
+                copied += 1
     return copied
 
 
-def _copy_plugin_directories(plugin_path: Path, target_path: Path, dir_names: list[str]) -> int:
+def _copy_plugin_directories(plugin_path: str, target_path: str, dir_names: list[str]) -> int:
     """Copy plugin directories. Returns count of items copied."""
     total = 0
     for dir_name in dir_names:
-        total += _copy_directory_contents(plugin_path / dir_name, target_path / dir_name)
+        total += _copy_directory_contents(
+            os.path.join(plugin_path, dir_name), os.path.join(target_path, dir_name)
+        )
     return total
 
 
 def _copy_plugin_to_target(plugin_path: Path, target_path: Path) -> int:
     """Copy all plugin files to target directory. Returns total files copied."""
-    target_path.mkdir(parents=True, exist_ok=True)
+    # Sub-paths are joined as plain strings; Path stays at the command boundary
+    plugin_str = os.fspath(plugin_path)
+    target_str = os.fspath(target_path)
+    os.makedirs(target_str, exist_ok=True)
     copied = 0
 
     # Copy commands with namespace prefix
-    copied += _copy_plugin_commands(plugin_path / "commands", target_path / "commands")
+    copied += _copy_plugin_commands(
+        os.path.join(plugin_str, "commands"), os.path.join(target_str, "commands")
+    )
 
     # Copy other directories
     other_dirs = ["agents", "templates", "scripts", "skills"]
-    copied += _copy_plugin_directories(plugin_path, target_path, other_dirs)
+    copied += _copy_plugin_directories(plugin_str, target_str, other_dirs)
 
     # Copy settings.json
-    settings_src = plugin_path / "settings.json"
-    settings_dst = target_path / "settings.json"
-    if settings_src.exists() and not settings_dst.exists():
+    settings_src = os.path.join(plugin_str, "settings.json")
+    settings_dst = os.path.join(target_str, "settings.json")
+    if os.path.exists(settings_src) and not os.path.lexists(settings_dst):
         shutil.copy2(settings_src, settings_dst)
         copied += 1
 
     return copied
 
 
-def _setup_commands_for_claude(commands_src: Path, commands_dst: Path) -> None:
+def _setup_commands_for_claude(commands_src: str, commands_dst: str) -> None:
     """Setup commands directory with namespace prefixes for Claude Code."""
-    if not commands_src.exists():
+    if not os.path.exists(commands_src):
         return
 
-    commands_dst.mkdir(exist_ok=True)
-    for item in commands_src.iterdir():
-        if item.suffix == ".md":
-            target_name = _get_command_target_name(item.name)
-            item_dst = commands_dst / target_name
-            if item_dst.is_symlink():
-                item_dst.unlink()
-            shutil.copy2(item, item_dst)
-
-            # Clean up legacy files that cause duplicate commands
-            # 1. Unprefixed symlinks
-            unprefixed_dst = commands_dst / item.name
-            if unprefixed_dst.is_symlink():
-                unprefixed_dst.unlink()
-
-            # 2. Old sahaidachny: prefixed files (migrated to saha: prefix)
-            if item.name == "saha.md":
-                old_prefixed = commands_dst / "sahaidachny.md"
-            else:
-                old_prefixed = commands_dst / f"sahaidachny:{item.name}"
-            if old_prefixed.exists() and old_prefixed != item_dst:
-                old_prefixed.unlink()
+    os.makedirs(commands_dst, exist_ok=True)
+    with os.scandir(commands_src) as it:
+        entries = [entry for entry in it if entry.name.endswith(".md")]
+    for entry in entries:
+        item_dst = os.path.join(commands_dst, _get_command_target_name(entry.name))
+        if os.path.islink(item_dst):
+            os.unlink(item_dst)
+        _fast_copy(entry.path, item_dst, entry.stat())
+
+        # Clean up legacy files that cause duplicate commands
+        # 1. Unprefixed symlinks
+        unprefixed_dst = os.path.join(commands_dst, entry.name)
+        if os.path.islink(unprefixed_dst):
+            os.unlink(unprefixed_dst)
 
+        # 2. Old sahaidachny: prefixed files (migrated to saha: prefix)
+        old_prefixed = os.path.join(commands_dst, _get_legacy_command_name(entry.name))
+        if old_prefixed != item_dst and os.path.lexists(old_prefixed):
+            os.unlink(old_prefixed)
 
-def _symlink_plugin_directory(src: Path, dst: Path) -> None:
+
+def _symlink_plugin_directory(src: str, dst: str) -> None:
     """Symlink a plugin directory, handling existing directories."""
-    if not src.exists():
+    if not os.path.exists(src):
         return
 
-    if dst.is_symlink():
-        dst.unlink()
-    elif dst.exists():
+    try:
+        dst_stat = os.lstat(dst)
+    except FileNotFoundError:
+        dst_stat = None
+
+    if dst_stat is not None and stat.S_ISLNK(dst_stat.st_mode):
+        os.unlink(dst)
+    elif dst_stat is not None:
         # Directory exists, merge by symlinking individual files
-        for item in src.iterdir():
-            item_dst = dst / item.name
-            if not item_dst.exists():
-                item_dst.symlink_to(item.resolve())
+        with os.scandir(src) as it:
+            for entry in it:
+                item_dst = os.path.join(dst, entry.name)
+                if not os.path.lexists(item_dst):
+                    os.symlink(os.path.realpath(entry.path), item_dst)
         return
 
-    dst.symlink_to(src.resolve())
+    os.symlink(os.path.realpath(src), dst)
 
 
-def _copy_plugin_directory(src: Path, dst: Path) -> None:
+def _copy_plugin_directory(src: str, dst: str) -> None:
     """Copy a plugin directory, replacing existing symlinks with actual files."""
-    if not src.exists():
+    if not os.path.exists(src):
         return
 
     # If destination is a symlink, remove it to replace with actual directory
-    if dst.is_symlink():
-        dst.unlink()
+    if os.path.islink(dst):
+        os.unlink(dst)
 
-    dst.mkdir(exist_ok=True)
+    os.makedirs(dst, exist_ok=True)
 
-    for item in src.rglob("*"):
-        if not item.is_file():
-            continue
-        rel = item.relative_to(src)
-        item_dst = dst / rel
-        if item_dst.is_symlink():
-            item_dst.unlink()
-        _sync_file(item, item_dst, force=True)
+    # _sync_file skips non-regular files and replaces symlinked destinations
+    for root, _dirs, files in os.walk(src, followlinks=False):
+        dst_root = os.path.join(dst, os.path.relpath(root, src))
+        if files:
+            os.makedirs(dst_root, exist_ok=True)
+        for name in files:
+            _sync_file(Path(root, name), Path(dst_root, name), force=True, make_parent=False)
 
 
 def _setup_plugin_directories_for_claude(plugin_path: Path, claude_dir: Path) -> None:
@@ -491,30 +798,33 @@ def _setup_plugin_directories_for_claude(plugin_path: Path, claude_dir: Path) ->
     don't follow directory symlinks, causing 'file not found' errors.
     Other directories use symlinks for efficiency.
     """
+    plugin_str = os.fspath(plugin_path)
+    claude_str = os.fspath(claude_dir)
+
     # Copy agents directory (Search/Glob doesn't follow symlinks)
-    _copy_plugin_directory(plugin_path / "agents", claude_dir / "agents")
+    _copy_plugin_directory(os.path.join(plugin_str, "agents"), os.path.join(claude_str, "agents"))
 
     # Symlink other directories
     symlink_dirs = ["templates", "scripts", "skills"]
     for dir_name in symlink_dirs:
-        src = plugin_path / dir_name
-        dst = claude_dir / dir_name
+        src = os.path.join(plugin_str, dir_name)
+        dst = os.path.join(claude_str, dir_name)
         _symlink_plugin_directory(src, dst)
 
 
 def _setup_settings_for_claude(plugin_path: Path, claude_dir: Path) -> None:
     """Copy settings.json and clean up old hooks.json."""
-    settings_src = plugin_path / "settings.json"
-    settings_dst = claude_dir / "settings.json"
-    if settings_src.exists():
-        if settings_dst.is_symlink():
-            settings_dst.unlink()
+    settings_src = os.path.join(plugin_path, "settings.json")
+    settings_dst = os.path.join(claude_dir, "settings.json")
+    if os.path.exists(settings_src):
+        if os.path.islink(settings_dst):
+            os.unlink(settings_dst)
         shutil.copy2(settings_src, settings_dst)
 
     # Remove old hooks.json symlink if it exists
-    old_hooks = claude_dir / "hooks.json"
-    if old_hooks.is_symlink():
-        old_hooks.unlink()
+    old_hooks = os.path.join(claude_dir, "hooks.json")
+    if os.path.islink(old_hooks):
+        os.unlink(old_hooks)
 
 
 def _echo_missing_plugin_locations() -> None:
@@ -525,6 +835,12 @@ def _echo_missing_plugin_locations() -> None:
     typer.echo(f"  - {sys.prefix}/share/sahaidachny/claude_plugin", err=True)
 
 
+@functools.lru_cache(maxsize=4)
+def _resolve_cli(cli_name: str) -> str | None:
+    """Locate a CLI executable on PATH, once per process."""
+    return shutil.which(cli_name)
+
+
 def _validate_cli_prerequisites(
     cli_name: Literal["claude", "codex", "gemini"],
     plugin_path: Path | None,
@@ -534,7 +850,7 @@ def _validate_cli_prerequisites(
     Returns:
         Tuple of (cli_executable_path, resolved_plugin_path).
     """
-    cli_path = shutil.which(cli_name)
+    cli_path = _resolve_cli(cli_name)
     if cli_path is None:
         pretty_name = {
             "claude": "Claude Code CLI",
@@ -555,10 +871,26 @@ def _validate_cli_prerequisites(
 
 
 def _run_cli(cli_path: str, args: list[str] | None = None) -> None:
-    """Run a CLI executable, forwarding optional arguments."""
+    """Run a CLI executable, forwarding optional arguments.
+
+    On POSIX the CLI replaces this process, so it owns the terminal and its
+    exit status directly. Windows has no real exec, so it runs as a child there.
+    cli_path is already resolved through PATH, so it is exec'd as is.
+    """
     cmd = [cli_path]
     if args:
         cmd.extend(args)
+
+    if sys.platform != "win32":
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execv(cli_path, cmd)
+        except OSError as e:
+            typer.echo(f"Error: failed to run {cli_path}: {e.strerror or e}", err=True)
+            raise typer.Exit(1) from None
+
+    # Only reached on Windows; execv never returns
     try:
         subprocess.run(cmd, check=False)
     except KeyboardInterrupt:
@@ -669,7 +1001,9 @@ def register_plugin_commands(app: typer.Typer) -> None:
         claude_dir.mkdir(exist_ok=True)
 
         # Setup plugin components
-        _setup_commands_for_claude(resolved_plugin / "commands", claude_dir / "commands")
+        _setup_commands_for_claude(
+            os.path.join(resolved_plugin, "commands"), os.path.join(claude_dir, "commands")
+        )
         _setup_plugin_directories_for_claude(resolved_plugin, claude_dir)
         _setup_settings_for_claude(resolved_plugin, claude_dir)
 
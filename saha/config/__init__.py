@@ -1,5 +1,5 @@
 """Configuration module for Saha orchestrator."""
 
-from saha.config.settings import Settings
+from saha.config.settings import Settings, get_settings
 
-__all__ = ["Settings"]
+__all__ = ["Settings", "get_settings"]
@@ -1,5 +1,6 @@
 """Configuration settings for Saha orchestrator."""
 
+import functools
 from pathlib import Path
 from typing import Literal
 
@@ -37,6 +38,16 @@ class AgentRunnerConfig(BaseModel):
     timeout: int = 300
 
 
+# Execution agent names mapped to their AgentsConfig field
+_AGENT_KEY_MAP = {
+    "execution-implementer": "implementer",
+    "execution-qa": "qa",
+    "execution-code-quality": "code_quality",
+    "execution-manager": "manager",
+    "execution-dod": "dod",
+}
+
+
 class AgentsConfig(BaseSettings):
     """Per-agent runner configuration.
 
@@ -69,18 +80,12 @@ class AgentsConfig(BaseSettings):
             AgentRunnerConfig for the agent.
         """
         # Normalize agent name to config key
-        name_map = {
-            "execution-implementer": "implementer",
-            "execution-qa": "qa",
-            "execution-code-quality": "code_quality",
-            "execution-manager": "manager",
-            "execution-dod": "dod",
-        }
-        key = name_map.get(agent_name, agent_name.replace("execution-", "").replace("-", "_"))
-
-        if hasattr(self, key):
-            config = getattr(self, key)
-            assert isinstance(config, AgentRunnerConfig)
+        key = _AGENT_KEY_MAP.get(agent_name)
+        if key is None:
+            key = agent_name.replace("execution-", "").replace("-", "_")
+
+        config = getattr(self, key, None)
+        if isinstance(config, AgentRunnerConfig):
             return config
 
         # Return default config with default runner
@@ -131,6 +136,10 @@ class Settings(BaseSettings):
 
     verbose: bool = False
     dry_run: bool = False
+    # Run test critique, QA and code quality agents concurrently. Each iteration
+    # then runs all three even when an earlier one fails, and streamed agent
+    # output interleaves on the console.
+    parallel_verification: bool = False
 
     tools: ToolConfig = Field(default_factory=ToolConfig)
     hooks: HookConfig = Field(default_factory=HookConfig)
@@ -172,3 +181,13 @@ class Settings(BaseSettings):
             AgentRunnerConfig with runner type, variant, and timeout.
         """
         return self.agents.get_config(agent_name)
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Settings loaded from the environment, constructed once per process.
+
+    Treat the result as read-only; derive variants with model_copy. Call
+    get_settings.cache_clear() to pick up environment changes.
+    """
+    return Settings()
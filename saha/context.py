@@ -4,12 +4,16 @@ Provides functions to set, get, clear, and resolve the active task context.
 The current task is stored in `.sahaidachny/current-task` file.
 """
 
+import os
 from pathlib import Path
 
-from saha.config.settings import Settings
+from saha.config.settings import Settings, get_settings
 
 CONTEXT_FILENAME = "current-task"
 
+# Context file contents keyed by path, validated against (mtime_ns, size)
+_CONTEXT_CACHE: dict[Path, tuple[int, int, str]] = {}
+
 
 def get_current_task(settings: Settings | None = None) -> str | None:
     """Read the current task ID from the context file.
@@ -17,13 +21,10 @@ def get_current_task(settings: Settings | None = None) -> str | None:
     Returns None if the file doesn't exist or the task directory
     has been deleted (stale context).
     """
-    settings = settings or Settings()
+    settings = settings or get_settings()
     context_file = settings.state_dir / CONTEXT_FILENAME
 
-    if not context_file.exists():
-        return None
-
-    task_id = context_file.read_text().strip()
+    task_id = _read_context_file(context_file)
     if not task_id:
         return None
 
@@ -43,7 +44,7 @@ def set_current_task(task_id: str, settings: Settings | None = None) -> None:
     Raises:
         ValueError: If no matching task directory is found.
     """
-    settings = settings or Settings()
+    settings = settings or get_settings()
     task_path = _find_task_dir(task_id, settings)
 
     if task_path is None:
@@ -51,7 +52,12 @@ def set_current_task(task_id: str, settings: Settings | None = None) -> None:
 
     settings.state_dir.mkdir(parents=True, exist_ok=True)
     context_file = settings.state_dir / CONTEXT_FILENAME
-    context_file.write_text(task_id)
+    fd = os.open(context_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, task_id.encode())
+    finally:
+        os.close(fd)
+    _CONTEXT_CACHE.pop(context_file, None)
 
 
 def clear_current_task(settings: Settings | None = None) -> bool:
@@ -59,13 +65,15 @@ def clear_current_task(settings: Settings | None = None) -> bool:
 
     Returns True if a context was cleared, False if none existed.
     """
-    settings = settings or Settings()
+    settings = settings or get_settings()
     context_file = settings.state_dir / CONTEXT_FILENAME
 
-    if not context_file.exists():
+    _CONTEXT_CACHE.pop(context_file, None)
+    # The unlink doubles as the existence check
+    try:
+        os.unlink(context_file)
+    except FileNotFoundError:
         return False
-
-    context_file.unlink()
     return True
 
 
@@ -83,7 +91,7 @@ def resolve_task_id(explicit_id: str | None = None, settings: Settings | None =
     if explicit_id is not None:
         return explicit_id
 
-    settings = settings or Settings()
+    settings = settings or get_settings()
     current = get_current_task(settings)
     if current is not None:
         return current
@@ -94,6 +102,29 @@ def resolve_task_id(explicit_id: str | None = None, settings: Settings | None =
     )
 
 
+def _read_context_file(context_file: Path) -> str | None:
+    """Read the stripped context file, reusing the last read while it is unchanged."""
+    try:
+        stat = os.stat(context_file)
+    except FileNotFoundError:
+        _CONTEXT_CACHE.pop(context_file, None)
+        return None
+
+    cached = _CONTEXT_CACHE.get(context_file)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    # The file holds a short task ID: read it raw instead of through a text wrapper
+    fd = os.open(context_file, os.O_RDONLY)
+    try:
+        data = os.read(fd, stat.st_size)
+    finally:
+        os.close(fd)
+    task_id = data.decode().strip()
+    _CONTEXT_CACHE[context_file] = (stat.st_mtime_ns, stat.st_size, task_id)
+    return task_id
+
+
 def _find_task_dir(task_id: str, settings: Settings) -> Path | None:
     """Find a task directory matching the task ID.
 
@@ -104,13 +135,18 @@ def _find_task_dir(task_id: str, settings: Settings) -> Path | None:
 
     # Exact match
     exact = base / task_id
-    if exact.is_dir():
+    if os.path.isdir(exact):
         return exact
 
     # Prefix match (e.g., task-01 matches task-01-my-feature)
-    if base.is_dir():
-        for entry in base.iterdir():
-            if entry.is_dir() and entry.name.startswith(f"{task_id}-"):
-                return entry
+    prefix = f"{task_id}-"
+    try:
+        with os.scandir(base) as entries:
+            for entry in entries:
+                # Name first: is_dir() only needs a stat for symlinked entries
+                if entry.name.startswith(prefix) and entry.is_dir():
+                    return Path(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
 
     return None
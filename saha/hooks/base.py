@@ -1,11 +1,11 @@
 """Base hook interface and event definitions."""
 
 from abc import ABC, abstractmethod
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 
-class HookEvent(str, Enum):
+class HookEvent(StrEnum):
     """Events that can trigger hooks."""
 
     # Loop lifecycle
@@ -31,9 +31,17 @@ class HookEvent(str, Enum):
     DOD_CHECK_START = "dod_check_start"
 
 
+# Default for hooks that listen to every event; shared so it is not rebuilt per access
+_EMPTY_EVENTS: list[HookEvent] = []
+
+
 class Hook(ABC):
     """Abstract base class for hooks."""
 
+    # _event_set: set of self.events, built on the first should_trigger call
+    __slots__ = ("_event_set",)
+    _event_set: frozenset[HookEvent]
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -43,7 +51,7 @@ class Hook(ABC):
     @property
     def events(self) -> list[HookEvent]:
         """Events this hook listens to. Empty means all events."""
-        return []
+        return _EMPTY_EVENTS
 
     @abstractmethod
     def execute(self, event: HookEvent, **kwargs: Any) -> None:
@@ -55,8 +63,17 @@ class Hook(ABC):
         """
         ...
 
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait for work the hook deferred in execute. No-op by default."""
+        return None
+
     def should_trigger(self, event: HookEvent) -> bool:
-        """Check if this hook should trigger for the given event."""
-        if not self.events:
-            return True
-        return event in self.events
+        """Check if this hook should trigger for the given event.
+
+        The events a hook listens to are fixed, so they are read once.
+        """
+        try:
+            event_set = self._event_set
+        except AttributeError:
+            event_set = self._event_set = frozenset(self.events)
+        return not event_set or event in event_set
@@ -1,16 +1,73 @@
 """Notification hooks using ntfy.sh."""
 
+import atexit
 import base64
+import http.client
 import logging
-import urllib.error
+import random
+import time
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
+from urllib.parse import unquote, urlsplit
 
 from saha.hooks.base import Hook, HookEvent
-from saha.models.state import ExecutionState, StepStatus
+from saha.models.state import ExecutionState, LoopPhase, StepStatus
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait on the ntfy server per request
+_SEND_TIMEOUT = 10
+
+# Transient failures (network errors, 5xx) are retried with exponential backoff
+_MAX_SEND_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 4.0
+_RETRY_JITTER = 0.25
+
+# Events NtfyHook notifies about
+_NOTIFY_EVENTS = [
+    HookEvent.LOOP_COMPLETE,
+    HookEvent.LOOP_FAILED,
+    HookEvent.LOOP_ERROR,
+    HookEvent.LOOP_STOPPED,
+]
+
+# Per-event (title, fallback message, priority, tags) templates. The message is
+# replaced by the iteration summary when there is one, except for LOOP_ERROR.
+_EVENT_TEMPLATES: dict[HookEvent, tuple[str, str, str, str]] = {
+    HookEvent.LOOP_COMPLETE: (
+        "Task Completed: {task_id}",
+        "Task {task_id} completed successfully after {iterations} iteration(s).",
+        "default",
+        "white_check_mark,robot",
+    ),
+    HookEvent.LOOP_FAILED: (
+        "Task Failed: {task_id}",
+        "Task {task_id} failed after {iterations} iteration(s).",
+        "high",
+        "x,warning",
+    ),
+    HookEvent.LOOP_ERROR: (
+        "Task Error: {task_id}",
+        "An error occurred after {iterations} iteration(s). Check logs for details.",
+        "urgent",
+        "warning,rotating_light",
+    ),
+    HookEvent.LOOP_STOPPED: (
+        "Task Stopped: {task_id}",
+        "Task {task_id} was stopped after {iterations} iteration(s).",
+        "default",
+        "pause_button,warning",
+    ),
+}
+_DEFAULT_TEMPLATE = ("Task Update: {task_id}", "Event: {event}", "default", "robot")
+
+# Human-readable phase names for iteration summaries
+_PHASE_DISPLAY: dict[LoopPhase, str] = {
+    phase: phase.value.replace("_", " ").title() for phase in LoopPhase
+}
+
 
 class NtfyHook(Hook):
     """Hook that sends notifications via ntfy.sh.
@@ -20,6 +77,21 @@ class NtfyHook(Hook):
     - Basic auth (SAHA_HOOK_NTFY_USER + SAHA_HOOK_NTFY_PASSWORD)
     """
 
+    __slots__ = (
+        "_auth_header",
+        "_connection",
+        "_enabled",
+        "_executor",
+        "_host",
+        "_last_send",
+        "_path",
+        "_proxy_headers",
+        "_request_target",
+        "_secure",
+        "_server",
+        "_topic",
+    )
+
     def __init__(
         self,
         topic: str,
@@ -32,9 +104,27 @@ class NtfyHook(Hook):
         self._topic = topic
         self._server = server.rstrip("/")
         self._enabled = enabled
-        self._token = token
-        self._user = user
-        self._password = password
+        # Credentials never change, so the Authorization value is encoded once
+        self._auth_header: str | None = None
+        if token:
+            self._auth_header = f"Bearer {token}"
+        elif user and password:
+            credentials = base64.b64encode(f"{user}:{password}".encode()).decode("ascii")
+            self._auth_header = f"Basic {credentials}"
+
+        server_url = urlsplit(self._server)
+        self._secure = server_url.scheme != "http"
+        self._host = server_url.netloc
+        self._path = f"{server_url.path}/{topic}"
+        # Kept alive between notifications so consecutive sends skip the TLS handshake
+        self._connection: http.client.HTTPConnection | None = None
+        # Set when the connection opens, since a plain HTTP proxy needs the full URL
+        self._request_target = self._path
+        self._proxy_headers: dict[str, str] = {}
+        # Sends run on one worker so the loop never waits on the network and
+        # notifications keep their order over the single connection
+        self._executor: ThreadPoolExecutor | None = None
+        self._last_send: Future[bool] | None = None
 
     @property
     def name(self) -> str:
@@ -43,12 +133,7 @@ class NtfyHook(Hook):
     @property
     def events(self) -> list[HookEvent]:
         """Only trigger on completion/failure/stop events."""
-        return [
-            HookEvent.LOOP_COMPLETE,
-            HookEvent.LOOP_FAILED,
-            HookEvent.LOOP_ERROR,
-            HookEvent.LOOP_STOPPED,
-        ]
+        return _NOTIFY_EVENTS
 
     def execute(self, event: HookEvent, **kwargs: Any) -> None:
         """Send notification via ntfy.sh."""
@@ -58,63 +143,51 @@ class NtfyHook(Hook):
         state: ExecutionState | None = kwargs.get("state")
         error: str | None = kwargs.get("error")
 
+        # Built here, not on the worker, so later changes to state are not picked up
         title, message, priority, tags = self._build_notification(event, state, error)
 
-        self._send(title, message, priority, tags)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ntfy")
+            # Deliver queued notifications at exit; close() drops this registration
+            atexit.register(self.close)
+        self._last_send = self._executor.submit(self._send, title, message, priority, tags)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait until queued notifications have been sent.
+
+        Re-raises an unexpected error from the last send; network failures are
+        retried and logged by the worker instead.
+        """
+        # The single worker sends in order, so the last send finishing means all did
+        if self._last_send is None:
+            return
+        try:
+            self._last_send.result(timeout)
+        except TimeoutError:
+            logger.warning("Timed out waiting for notifications to be sent")
 
     def _build_notification(
         self,
         event: HookEvent,
         state: ExecutionState | None,
         error: str | None,
-    ) -> tuple[str, str, str, list[str]]:
-        """Build notification content with iteration summary."""
+    ) -> tuple[str, str, str, str]:
+        """Build notification content with iteration summary.
+
+        Returns (title, message, priority, comma-joined tags).
+        """
         task_id = state.task_id if state else "unknown"
         iterations = state.current_iteration if state else 0
 
-        # Build summary from iteration data
-        summary = self._build_iteration_summary(state)
+        title, message, priority, tags = _EVENT_TEMPLATES.get(event, _DEFAULT_TEMPLATE)
+        title = title.format(task_id=task_id)
+        message = message.format(task_id=task_id, iterations=iterations, event=event.value)
 
-        if event == HookEvent.LOOP_COMPLETE:
-            return (
-                f"Task Completed: {task_id}",
-                summary
-                or f"Task {task_id} completed successfully after {iterations} iteration(s).",
-                "default",
-                ["white_check_mark", "robot"],
-            )
-
-        elif event == HookEvent.LOOP_FAILED:
-            return (
-                f"Task Failed: {task_id}",
-                summary or f"Task {task_id} failed after {iterations} iteration(s).",
-                "high",
-                ["x", "warning"],
-            )
-
-        elif event == HookEvent.LOOP_ERROR:
-            # Don't leak error details - just indicate an error occurred
-            return (
-                f"Task Error: {task_id}",
-                f"An error occurred after {iterations} iteration(s). Check logs for details.",
-                "urgent",
-                ["warning", "rotating_light"],
-            )
-
-        elif event == HookEvent.LOOP_STOPPED:
-            return (
-                f"Task Stopped: {task_id}",
-                summary or f"Task {task_id} was stopped after {iterations} iteration(s).",
-                "default",
-                ["pause_button", "warning"],
-            )
+        # Error notifications never carry a summary, so nothing sensitive leaks
+        if event != HookEvent.LOOP_ERROR:
+            message = self._build_iteration_summary(state) or message
 
-        return (
-            f"Task Update: {task_id}",
-            summary or f"Event: {event.value}",
-            "default",
-            ["robot"],
-        )
+        return title, message, priority, tags
 
     def _build_iteration_summary(self, state: ExecutionState | None) -> str:
         """Build a safe summary with no sensitive information.
@@ -133,11 +206,10 @@ class NtfyHook(Hook):
             phases_failed = []
 
             for step in iteration.steps:
-                phase_name = step.phase.value.replace("_", " ").title()
-                if step.status == StepStatus.COMPLETED:
-                    phases_done.append(phase_name)
-                elif step.status == StepStatus.FAILED:
-                    phases_failed.append(phase_name)
+                if step.status is StepStatus.COMPLETED:
+                    phases_done.append(_PHASE_DISPLAY[step.phase])
+                elif step.status is StepStatus.FAILED:
+                    phases_failed.append(_PHASE_DISPLAY[step.phase])
 
             # Add iteration header if multiple iterations
             if total_iterations > 1:
@@ -146,9 +218,9 @@ class NtfyHook(Hook):
 
             # Just list phases without details
             if phases_done:
-                lines.append(f"  Done: {', '.join(phases_done)}")
+                lines.append("  Done: " + ", ".join(phases_done))
             if phases_failed:
-                lines.append(f"  Failed: {', '.join(phases_failed)}")
+                lines.append("  Failed: " + ", ".join(phases_failed))
 
         # Final status (generic)
         final_iter = state.iterations[-1]
@@ -164,54 +236,133 @@ class NtfyHook(Hook):
         title: str,
         message: str,
         priority: str,
-        tags: list[str],
+        tags: str,
     ) -> bool:
         """Send the notification to ntfy.sh."""
-        url = f"{self._server}/{self._topic}"
-
-        # Use ASCII-safe title to avoid encoding issues
-        safe_title = title.encode("ascii", errors="replace").decode("ascii")
+        # Use ASCII-safe title to avoid encoding issues; task slugs are usually ASCII already
+        safe_title = (
+            title if title.isascii() else title.encode("ascii", errors="replace").decode("ascii")
+        )
 
         headers = {
             "Title": safe_title,
             "Priority": priority,
-            "Tags": ",".join(tags),
+            "Tags": tags,
         }
 
-        # Add authentication
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        elif self._user and self._password:
-            credentials = f"{self._user}:{self._password}"
-            encoded = base64.b64encode(credentials.encode()).decode("ascii")
-            headers["Authorization"] = f"Basic {encoded}"
-
-        try:
-            req = urllib.request.Request(
-                url,
-                data=message.encode("utf-8"),
-                headers=headers,
-                method="POST",
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
+        if self._auth_header:
+            headers["Authorization"] = self._auth_header
+
+        body = message.encode("utf-8")
+        # Retries never stretch a send past what the attempts' timeouts allow
+        deadline = time.monotonic() + _SEND_TIMEOUT * _MAX_SEND_ATTEMPTS
+        for attempt in range(1, _MAX_SEND_ATTEMPTS + 1):
+            try:
+                status = self._post(body, headers)
+            except (http.client.HTTPException, OSError) as e:
+                log_failure, failure = logger.error, f"Failed to send notification: {e}"
+            else:
+                if status == 200:
                     logger.info(f"Notification sent: {title}")
                     return True
-                else:
-                    logger.warning(f"Notification failed with status: {response.status}")
-                    return False
+                log_failure, failure = logger.warning, f"Notification failed with status: {status}"
+                if status < 500:
+                    break
+
+            delay = min(_RETRY_BASE_DELAY * 2 ** (attempt - 1), _RETRY_MAX_DELAY)
+            delay += random.uniform(0, _RETRY_JITTER)
+            if attempt == _MAX_SEND_ATTEMPTS or time.monotonic() + delay > deadline:
+                break
+            logger.debug(f"{failure}; retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+        log_failure(failure)
+        return False
+
+    def _post(self, body: bytes, headers: dict[str, str]) -> int:
+        """POST to the topic over the kept-alive connection. Returns the HTTP status."""
+        reused = self._connection is not None
+        try:
+            return self._request(body, headers)
+        except ConnectionError:
+            # The server may have closed an idle keep-alive connection; retry once fresh
+            self._close_connection()
+            if not reused:
+                raise
+        except (http.client.HTTPException, OSError):
+            self._close_connection()
+            raise
+        return self._request(body, headers)
+
+    def _request(self, body: bytes, headers: dict[str, str]) -> int:
+        """Send one POST on the current connection, opening it if needed."""
+        if self._connection is None:
+            self._connection = self._open_connection()
+        if self._proxy_headers:
+            headers = {**headers, **self._proxy_headers}
+        self._connection.request("POST", self._request_target, body=body, headers=headers)
+        with self._connection.getresponse() as response:
+            # Drain the body so the connection can carry the next request
+            response.read()
+            return response.status
+
+    def _open_connection(self) -> http.client.HTTPConnection:
+        """Connect to the ntfy server, through the proxy from the environment if one applies.
+
+        Honours HTTP_PROXY, HTTPS_PROXY and NO_PROXY the way urllib does. HTTPS is
+        tunnelled through the proxy with CONNECT; plain HTTP is forwarded by it.
+        """
+        self._request_target = self._path
+        self._proxy_headers = {}
+        hostname = urlsplit(f"//{self._host}").hostname or self._host
+        proxy = None
+        if not urllib.request.proxy_bypass(hostname):
+            proxy = urllib.request.getproxies().get("https" if self._secure else "http")
+        if not proxy:
+            connection_class = (
+                http.client.HTTPSConnection if self._secure else http.client.HTTPConnection
+            )
+            return connection_class(self._host, timeout=_SEND_TIMEOUT)
+
+        proxy_url = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        proxy_host = proxy_url.hostname or ""
+        proxy_port = proxy_url.port or (443 if proxy_url.scheme == "https" else 80)
+        proxy_headers: dict[str, str] = {}
+        if proxy_url.username:
+            credentials = f"{unquote(proxy_url.username)}:{unquote(proxy_url.password or '')}"
+            encoded = base64.b64encode(credentials.encode()).decode("ascii")
+            proxy_headers["Proxy-Authorization"] = f"Basic {encoded}"
+
+        if self._secure:
+            connection = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=_SEND_TIMEOUT)
+            connection.set_tunnel(self._host, headers=proxy_headers)
+            return connection
+
+        self._request_target = f"http://{self._host}{self._path}"
+        self._proxy_headers = proxy_headers
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=_SEND_TIMEOUT)
 
-        except urllib.error.URLError as e:
-            logger.error(f"Failed to send notification: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Notification error: {e}")
-            return False
+    def close(self) -> None:
+        """Send queued notifications and close the connection to the ntfy server."""
+        if self._executor is not None:
+            atexit.unregister(self.close)
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._close_connection()
+
+    def _close_connection(self) -> None:
+        """Drop the connection so the next send opens a fresh one."""
+        # Runs on the send worker, so it must not touch the executor
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
 
 
 class LoggingHook(Hook):
     """Hook that logs all events for debugging."""
 
+    __slots__ = ("_log_level",)
+
     def __init__(self, log_level: int = logging.INFO):
         self._log_level = log_level
 
@@ -221,6 +372,10 @@ class LoggingHook(Hook):
 
     def execute(self, event: HookEvent, **kwargs: Any) -> None:
         """Log the event."""
+        # Skip building the message when the record would be dropped anyway
+        if not logger.isEnabledFor(self._log_level):
+            return
+
         state: ExecutionState | None = kwargs.get("state")
         task_id = state.task_id if state else "unknown"
         iteration = state.current_iteration if state else 0
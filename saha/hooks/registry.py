@@ -7,16 +7,25 @@ from saha.hooks.base import Hook, HookEvent
 
 logger = logging.getLogger(__name__)
 
+# Event names resolved with a plain dict lookup; HookEvent members hash as their values
+_EVENTS_BY_NAME: dict[str, HookEvent] = {event.value: event for event in HookEvent}
+
 
 class HookRegistry:
     """Registry for managing hooks."""
 
+    __slots__ = ("_by_event", "_hooks")
+
     def __init__(self) -> None:
         self._hooks: list[Hook] = []
+        # Hooks per event in registration order, so trigger skips non-listeners
+        self._by_event: dict[HookEvent, list[Hook]] = {event: [] for event in HookEvent}
 
     def register(self, hook: Hook) -> None:
         """Register a hook."""
         self._hooks.append(hook)
+        for event in hook.events or HookEvent:
+            self._by_event[event].append(hook)
         logger.debug(f"Registered hook: {hook.name}")
 
     def unregister(self, hook_name: str) -> bool:
@@ -24,6 +33,9 @@ class HookRegistry:
         for i, hook in enumerate(self._hooks):
             if hook.name == hook_name:
                 del self._hooks[i]
+                for listeners in self._by_event.values():
+                    if hook in listeners:
+                        listeners.remove(hook)
                 logger.debug(f"Unregistered hook: {hook_name}")
                 return True
         return False
@@ -35,19 +47,24 @@ class HookRegistry:
             event: Event name or HookEvent enum.
             **kwargs: Event-specific data to pass to hooks.
         """
-        if isinstance(event, str):
+        resolved = _EVENTS_BY_NAME.get(event)
+        if resolved is None:
+            logger.warning(f"Unknown event: {event}")
+            return
+
+        for hook in self._by_event[resolved]:
             try:
-                event = HookEvent(event)
-            except ValueError:
-                logger.warning(f"Unknown event: {event}")
-                return
+                hook.execute(resolved, **kwargs)
+            except Exception as e:
+                logger.error(f"Hook {hook.name} failed for event {resolved}: {e}")
 
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait for hooks that deliver in the background to finish."""
         for hook in self._hooks:
-            if hook.should_trigger(event):
-                try:
-                    hook.execute(event, **kwargs)
-                except Exception as e:
-                    logger.error(f"Hook {hook.name} failed for event {event}: {e}")
+            try:
+                hook.flush(timeout)
+            except Exception as e:
+                logger.error(f"Hook {hook.name} failed to flush: {e}")
 
     def list_hooks(self) -> list[str]:
         """List all registered hook names."""
@@ -56,3 +73,5 @@ class HookRegistry:
     def clear(self) -> None:
         """Clear all registered hooks."""
         self._hooks.clear()
+        for listeners in self._by_event.values():
+            listeners.clear()
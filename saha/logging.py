@@ -1,91 +1,108 @@
 """Rich-enhanced logging for Sahaidachny.
 
 Provides colored, readable log output with filtering for verbose tool messages.
+
+Rich is imported on first use of the console, so importing this module stays
+cheap for headless and library callers.
 """
 
+import functools
 import logging
 import os
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.theme import Theme
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.logging import RichHandler
+    from rich.theme import Theme
 
 # Cossack-inspired theme: bold blue/yellow palette with good terminal visibility
-SAHA_THEME = Theme(
-    {
-        # Log levels
-        "info": "bright_cyan",
-        "warning": "bright_yellow",
-        "error": "bold red",
-        "critical": "bold white on red",
-        "debug": "bright_black",
-        # Execution phases
-        "phase": "bold bright_blue",
-        "phase.border": "bright_blue",
-        "iteration": "bold bright_yellow",
-        "iteration.border": "bright_yellow",
-        "task": "bold bright_cyan",
-        # Tool calls - subdued, supporting information
-        "tool": "dim",
-        "tool.name": "cyan",
-        "tool.detail": "dim",
-        # Status indicators
-        "success": "bold bright_green",
-        "failure": "bold bright_red",
-        # Prompt display
-        "prompt": "white",
-        "prompt.header": "bold bright_yellow",
-        "prompt.border": "bright_yellow",
-        # Token usage
-        "usage.border": "bright_black",
-        "usage.label": "bold bright_cyan",
-        "usage.value": "white",
-        "usage.muted": "dim",
-    }
-)
-
-# Shared console instance
-console = Console(theme=SAHA_THEME)
+_SAHA_STYLES = {
+    # Log levels
+    "info": "bright_cyan",
+    "warning": "bright_yellow",
+    "error": "bold red",
+    "critical": "bold white on red",
+    "debug": "bright_black",
+    # Execution phases
+    "phase": "bold bright_blue",
+    "phase.border": "bright_blue",
+    "iteration": "bold bright_yellow",
+    "iteration.border": "bright_yellow",
+    "task": "bold bright_cyan",
+    # Tool calls - subdued, supporting information
+    "tool": "dim",
+    "tool.name": "cyan",
+    "tool.detail": "dim",
+    # Status indicators
+    "success": "bold bright_green",
+    "failure": "bold bright_red",
+    # Prompt display
+    "prompt": "white",
+    "prompt.header": "bold bright_yellow",
+    "prompt.border": "bright_yellow",
+    # Token usage
+    "usage.border": "bright_black",
+    "usage.label": "bold bright_cyan",
+    "usage.value": "white",
+    "usage.muted": "dim",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _saha_theme() -> "Theme":
+    from rich.theme import Theme
+
+    return Theme(_SAHA_STYLES)
+
+
+@functools.lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Return the shared console instance, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console(theme=_saha_theme())
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `console` and `SAHA_THEME` available for callers that import them directly
+    if name == "console":
+        return get_console()
+    if name == "SAHA_THEME":
+        return _saha_theme()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SahaLogFilter(logging.Filter):
     """Filter out verbose/noisy log messages unless in debug mode."""
 
-    VERBOSE_PATTERNS: ClassVar[list[str]] = [
-        "Command stdout length:",
+    __slots__ = ("debug",)
+
+    # Ordered by how often the runners emit them, most frequent first
+    VERBOSE_PATTERNS: ClassVar[tuple[str, ...]] = (
         "Command exit code:",
-        "Executing command:",
+        "Command stdout length:",
         "Command stderr:",
-    ]
+        "Executing command:",
+    )
+    # One regex scan per record instead of a substring test per pattern
+    _VERBOSE_RE: ClassVar[re.Pattern[str]] = re.compile(
+        "|".join(re.escape(pattern) for pattern in VERBOSE_PATTERNS)
+    )
 
     def __init__(self, debug: bool = False):
         super().__init__()
         self.debug = debug
 
     def filter(self, record: logging.LogRecord) -> bool:
-        if self.debug:
+        # Warnings and errors are never noise; skip formatting their message
+        if self.debug or record.levelno >= logging.WARNING:
             return True
 
-        msg = record.getMessage()
-        return not any(pattern in msg for pattern in self.VERBOSE_PATTERNS)
-
-
-class SahaRichHandler(RichHandler):
-    """Custom RichHandler with Sahaidachny-specific formatting."""
-
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(
-            console=console,
-            show_time=True,
-            show_path=False,
-            rich_tracebacks=True,
-            tracebacks_show_locals=False,
-            markup=False,
-            **kwargs,
-        )
+        return self._VERBOSE_RE.search(record.getMessage()) is None
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -98,7 +115,7 @@ def setup_logging(verbose: bool = False) -> None:
     level = logging.DEBUG if verbose else logging.INFO
 
     # Create handler
-    handler = SahaRichHandler()
+    handler = _create_rich_handler()
     handler.addFilter(SahaLogFilter(debug=verbose))
     file_handler = _create_file_handler(verbose)
 
@@ -117,6 +134,19 @@ def setup_logging(verbose: bool = False) -> None:
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+def _create_rich_handler() -> "RichHandler":
+    from rich.logging import RichHandler
+
+    return RichHandler(
+        console=get_console(),
+        show_time=True,
+        show_path=False,
+        rich_tracebacks=True,
+        tracebacks_show_locals=False,
+        markup=False,
+    )
+
+
 def _create_file_handler(verbose: bool) -> logging.FileHandler:
     log_dir = Path(".saha_logs")
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -135,11 +165,23 @@ def _create_file_handler(verbose: bool) -> logging.FileHandler:
     return handler
 
 
+# Banner rules, styled once; each helper prints its banner in a single call
+_RULE = "─" * 50
+_DOUBLE_RULE = "═" * 50
+_PHASE_RULE_LINE = f"[phase.border]{_RULE}[/phase.border]"
+_USAGE_RULE_LINE = f"[usage.border]{_RULE}[/usage.border]"
+_SUCCESS_RULE_LINE = f"[success]{_DOUBLE_RULE}[/success]"
+_FAILURE_RULE_LINE = f"[failure]{_DOUBLE_RULE}[/failure]"
+_WARNING_RULE_LINE = f"[warning]{_DOUBLE_RULE}[/warning]"
+
+
 def log_phase_start(phase: str, task_id: str) -> None:
     """Log the start of a loop phase with prominent styling."""
-    console.print(f"\n[phase.border]{'─' * 50}[/phase.border]")
-    console.print(f"[phase]▶ {phase.upper()}[/phase] [task]{task_id}[/task]")
-    console.print(f"[phase.border]{'─' * 50}[/phase.border]")
+    get_console().print(
+        f"\n{_PHASE_RULE_LINE}\n"
+        f"[phase]▶ {phase.upper()}[/phase] [task]{task_id}[/task]\n"
+        f"{_PHASE_RULE_LINE}"
+    )
 
 
 def log_phase_complete(phase: str, message: str = "") -> None:
@@ -147,17 +189,17 @@ def log_phase_complete(phase: str, message: str = "") -> None:
     msg = f"[success]✓ {phase} complete[/success]"
     if message:
         msg += f" - {message}"
-    console.print(msg)
+    get_console().print(msg)
 
 
 def log_phase_failed(phase: str, error: str) -> None:
     """Log phase failure."""
-    console.print(f"[failure]✗ {phase} failed[/failure]: {error}")
+    get_console().print(f"[failure]✗ {phase} failed[/failure]: {error}")
 
 
 def log_iteration_start(iteration: int, max_iterations: int) -> None:
     """Log the start of a loop iteration."""
-    console.print(
+    get_console().print(
         f"\n[iteration.border]━━━[/iteration.border] [iteration]Iteration {iteration}/{max_iterations}[/iteration] [iteration.border]━━━[/iteration.border]"
     )
 
@@ -174,7 +216,7 @@ def log_iteration_complete(iteration: int, dod_achieved: bool, quality_passed: b
     else:
         status_parts.append("[failure]Quality ✗[/failure]")
 
-    console.print(
+    get_console().print(
         f"[iteration.border]━━━[/iteration.border] [iteration]Iteration {iteration} complete[/iteration]: {' | '.join(status_parts)}"
     )
 
@@ -184,32 +226,38 @@ def log_tool_call(tool_name: str, details: str = "") -> None:
     msg = f"  [tool.name]{tool_name}[/tool.name]"
     if details:
         msg += f" [tool.detail]{details[:80]}{'...' if len(details) > 80 else ''}[/tool.detail]"
-    console.print(msg)
+    get_console().print(msg)
 
 
 def log_task_complete(task_id: str, iterations: int) -> None:
     """Log successful task completion."""
-    console.print(f"\n[success]{'═' * 50}[/success]")
-    console.print(f"[success]✓ TASK COMPLETE: {task_id}[/success]")
-    console.print(f"[success]  Iterations: {iterations}[/success]")
-    console.print(f"[success]{'═' * 50}[/success]")
+    get_console().print(
+        f"\n{_SUCCESS_RULE_LINE}\n"
+        f"[success]✓ TASK COMPLETE: {task_id}[/success]\n"
+        f"[success]  Iterations: {iterations}[/success]\n"
+        f"{_SUCCESS_RULE_LINE}"
+    )
 
 
 def log_task_failed(task_id: str, error: str) -> None:
     """Log task failure."""
-    console.print(f"\n[failure]{'═' * 50}[/failure]")
-    console.print(f"[failure]✗ TASK FAILED: {task_id}[/failure]")
-    console.print(f"[failure]  Error: {error}[/failure]")
-    console.print(f"[failure]{'═' * 50}[/failure]")
+    get_console().print(
+        f"\n{_FAILURE_RULE_LINE}\n"
+        f"[failure]✗ TASK FAILED: {task_id}[/failure]\n"
+        f"[failure]  Error: {error}[/failure]\n"
+        f"{_FAILURE_RULE_LINE}"
+    )
 
 
 def log_task_stopped(task_id: str, reason: str | None = None) -> None:
     """Log task stop (user interrupted)."""
-    console.print(f"\n[warning]{'═' * 50}[/warning]")
-    console.print(f"[warning]■ TASK STOPPED: {task_id}[/warning]")
-    if reason:
-        console.print(f"[warning]  Reason: {reason}[/warning]")
-    console.print(f"[warning]{'═' * 50}[/warning]")
+    reason_line = f"[warning]  Reason: {reason}[/warning]\n" if reason else ""
+    get_console().print(
+        f"\n{_WARNING_RULE_LINE}\n"
+        f"[warning]■ TASK STOPPED: {task_id}[/warning]\n"
+        f"{reason_line}"
+        f"{_WARNING_RULE_LINE}"
+    )
 
 
 def log_agent_prompt(agent_name: str, prompt: str) -> None:
@@ -219,13 +267,19 @@ def log_agent_prompt(agent_name: str, prompt: str) -> None:
         agent_name: Name of the agent (e.g., "Implementation", "QA").
         prompt: The full prompt text.
     """
-    console.print(
-        f"[prompt.border]┌─[/prompt.border] [prompt.header]Prompt → {agent_name}[/prompt.header]"
+    from rich.panel import Panel
+    from rich.text import Text
+
+    # Render once as a Text body so prompt contents are never parsed as markup
+    get_console().print(
+        Panel(
+            Text(prompt, style="prompt"),
+            title=f"[prompt.header]Prompt → {agent_name}[/prompt.header]",
+            title_align="left",
+            border_style="prompt.border",
+            padding=(0, 1),
+        )
     )
-    # Indent each line of the prompt
-    for line in prompt.split("\n"):
-        console.print(f"[prompt.border]│[/prompt.border] [prompt]{line}[/prompt]")
-    console.print(f"[prompt.border]└{'─' * 40}[/prompt.border]")
 
 
 def log_token_usage(
@@ -233,8 +287,8 @@ def log_token_usage(
 ) -> None:
     """Log token usage for a phase with a distinct visual section."""
     if not token_usage and (tokens_used is None or tokens_used <= 0):
-        console.print(f"[usage.border]{'─' * 50}[/usage.border]")
-        console.print(
+        get_console().print(
+            f"{_USAGE_RULE_LINE}\n"
             f"[usage.label]Token usage ({phase})[/usage.label] [usage.muted]n/a[/usage.muted]"
         )
         return
@@ -259,7 +313,7 @@ def log_token_usage(
         parts.append(f"total={tokens_used}")
 
     details = ", ".join(parts) if parts else "n/a"
-    console.print(f"[usage.border]{'─' * 50}[/usage.border]")
-    console.print(
+    get_console().print(
+        f"{_USAGE_RULE_LINE}\n"
         f"[usage.label]Token usage ({phase})[/usage.label] [usage.value]{details}[/usage.value]"
     )
@@ -4,7 +4,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ResultStatus(str, Enum):
@@ -19,11 +19,15 @@ class ResultStatus(str, Enum):
 class ToolResult(BaseModel):
     """Result from running an external tool."""
 
+    # Built once by a tool runner and only read afterwards
+    model_config = ConfigDict(frozen=True)
+
     tool_name: str
     status: ResultStatus
     exit_code: int = 0
-    stdout: str = ""
-    stderr: str = ""
+    # Captured output can be large; keep it out of reprs and log lines
+    stdout: str = Field(default="", repr=False)
+    stderr: str = Field(default="", repr=False)
     issues: list[str] = Field(default_factory=list)
     metrics: dict[str, Any] = Field(default_factory=dict)
 
@@ -34,6 +34,18 @@ class StepStatus(StrEnum):
     SKIPPED = "skipped"
 
 
+# Phases in which the loop is not actively working on a task
+_NOT_RUNNING_PHASES: frozenset[LoopPhase] = frozenset(
+    {
+        LoopPhase.IDLE,
+        LoopPhase.SCHEDULED,
+        LoopPhase.STOPPED,
+        LoopPhase.COMPLETED,
+        LoopPhase.FAILED,
+    }
+)
+
+
 class StepRecord(BaseModel):
     """Record of a single step execution."""
 
@@ -83,27 +95,24 @@ class ExecutionState(BaseModel):
     @property
     def is_running(self) -> bool:
         """Check if the loop is currently running."""
-        return self.current_phase not in (
-            LoopPhase.IDLE,
-            LoopPhase.SCHEDULED,
-            LoopPhase.STOPPED,
-            LoopPhase.COMPLETED,
-            LoopPhase.FAILED,
-        )
+        return self.current_phase not in _NOT_RUNNING_PHASES
 
     @property
     def current_iteration_record(self) -> IterationRecord | None:
         """Get the current iteration record."""
-        if not self.iterations:
-            return None
-        return self.iterations[-1]
+        iterations = self.iterations
+        return iterations[-1] if iterations else None
 
     def start_iteration(self) -> IterationRecord:
         """Start a new iteration."""
         self.current_iteration += 1
-        record = IterationRecord(
+        # Built from trusted values, so validation is skipped; it runs when state is loaded
+        record = IterationRecord.model_construct(
             iteration=self.current_iteration,
             started_at=datetime.now(),
+            steps=[],
+            files_changed=[],
+            files_added=[],
         )
         self.iterations.append(record)
         return record
@@ -116,16 +125,18 @@ class ExecutionState(BaseModel):
         output_summary: str | None = None,
     ) -> StepRecord:
         """Record a step in the current iteration."""
-        if not self.iterations:
-            self.start_iteration()
+        iterations = self.iterations
+        record = iterations[-1] if iterations else self.start_iteration()
 
-        step = StepRecord(
+        now = datetime.now()
+        step = StepRecord.model_construct(
             phase=phase,
             status=status,
-            started_at=datetime.now() if status == StepStatus.IN_PROGRESS else None,
-            completed_at=datetime.now() if status == StepStatus.COMPLETED else None,
+            started_at=now if status is StepStatus.IN_PROGRESS else None,
+            completed_at=now if status is StepStatus.COMPLETED else None,
+            attempt=1,
             error=error,
             output_summary=output_summary,
         )
-        self.iterations[-1].steps.append(step)
+        record.steps.append(step)
         return step
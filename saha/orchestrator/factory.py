@@ -1,5 +1,7 @@
 """Factory functions for creating the agentic loop orchestrator."""
 
+import functools
+from collections.abc import Callable
 from pathlib import Path
 
 import typer
@@ -10,12 +12,18 @@ from saha.hooks.registry import HookRegistry
 from saha.orchestrator.loop import AgenticLoop
 from saha.orchestrator.state import StateManager
 from saha.runners.base import Runner
-from saha.runners.claude import ClaudeRunner, MockRunner
-from saha.runners.codex import CodexRunner
-from saha.runners.gemini import GeminiRunner
 from saha.runners.registry import AgentConfig, RunnerRegistry, RunnerType
 from saha.tools.registry import create_default_registry
 
+# Execution agents with a runner assignment, paired with their AgentsConfig field
+_AGENT_SPECS = (
+    ("execution-implementer", "implementer"),
+    ("execution-qa", "qa"),
+    ("execution-code-quality", "code_quality"),
+    ("execution-manager", "manager"),
+    ("execution-dod", "dod"),
+)
+
 
 def create_runner_registry(settings: Settings) -> RunnerRegistry:
     """Create and configure the runner registry.
@@ -24,56 +32,30 @@ def create_runner_registry(settings: Settings) -> RunnerRegistry:
     per-agent runner assignments based on settings.
     """
     registry = RunnerRegistry()
+    cwd = Path.cwd()
 
-    # Register runner factories
-    # Stream output by default for transparency during execution
-    registry.register_factory(
-        RunnerType.CLAUDE,
-        ClaudeRunner,
-        model=settings.claude_model,
-        working_dir=Path.cwd(),
-        stream_output=True,
-        skip_permissions=settings.claude_dangerously_skip_permissions,
-    )
-
-    registry.register_factory(
-        RunnerType.CODEX,
-        CodexRunner,
-        model=settings.codex_model,
-        working_dir=Path.cwd(),
-        sandbox=settings.codex_sandbox,
-        dangerously_bypass=settings.codex_dangerously_bypass_sandbox,
-    )
-
-    registry.register_factory(
-        RunnerType.GEMINI,
-        GeminiRunner,
-        model=settings.gemini_model,
-        working_dir=Path.cwd(),
-    )
-
-    registry.register_factory(RunnerType.MOCK, MockRunner)
+    # Register runner factories; backend modules are only imported when a
+    # runner of that type is first requested
+    for runner_type, create_runner in _RUNNER_FACTORIES.items():
+        registry.register_factory(
+            RunnerType(runner_type), functools.partial(create_runner, settings, cwd)
+        )
 
     # Set default runner type
     default_type = RunnerType(settings.agents.default_runner)
     registry.set_default_runner(default_type)
 
-    # Configure per-agent runners from settings
-    agent_mapping = {
-        "execution-implementer": settings.agents.implementer,
-        "execution-qa": settings.agents.qa,
-        "execution-code-quality": settings.agents.code_quality,
-        "execution-manager": settings.agents.manager,
-        "execution-dod": settings.agents.dod,
-    }
-
-    for agent_name, config in agent_mapping.items():
-        fields_set: set[str] = getattr(config, "model_fields_set", set())
-        runner_name = config.runner if "runner" in fields_set else default_type.value
+    # Configure per-agent runners from settings; agents without an explicit
+    # runner fall back to the default
+    for agent_name, field_name in _AGENT_SPECS:
+        config = getattr(settings.agents, field_name)
+        runner_type = (
+            RunnerType(config.runner) if "runner" in config.model_fields_set else default_type
+        )
         registry.configure_agent(
             AgentConfig(
                 agent_name=agent_name,
-                runner_type=RunnerType(runner_name),
+                runner_type=runner_type,
                 agent_variant=config.variant,
                 timeout=config.timeout,
             )
@@ -98,58 +80,78 @@ def validate_configured_runners(registry: RunnerRegistry, settings: Settings) ->
     # Collect unique runner types actually in use
     configured_types: set[RunnerType] = {RunnerType(settings.agents.default_runner)}
 
-    agent_configs = [
-        settings.agents.implementer,
-        settings.agents.qa,
-        settings.agents.code_quality,
-        settings.agents.manager,
-        settings.agents.dod,
-    ]
-
-    for config in agent_configs:
-        configured_types.add(RunnerType(config.runner))
+    for _, field_name in _AGENT_SPECS:
+        configured_types.add(RunnerType(getattr(settings.agents, field_name).runner))
+    # Mock is always available
+    configured_types.discard(RunnerType.MOCK)
 
     # Validate each configured runner type
     unavailable: list[str] = []
     for runner_type in configured_types:
-        if runner_type == RunnerType.MOCK:
-            continue  # Mock is always available
-
-        runner = registry.get_runner(runner_type)
-        if not runner.is_available():
-            unavailable.append(runner.get_name())
+        if not registry.is_runner_available(runner_type):
+            unavailable.append(registry.get_runner(runner_type).get_name())
 
     if unavailable:
-        typer.echo("Error: The following configured runners are not available:", err=True)
-        for name in unavailable:
-            typer.echo(f"  - {name}", err=True)
-        typer.echo("\nInstall missing CLIs or change runner configuration.", err=True)
+        missing = "".join(f"\n  - {name}" for name in unavailable)
+        typer.echo(
+            f"Error: The following configured runners are not available:{missing}\n"
+            "\nInstall missing CLIs or change runner configuration.",
+            err=True,
+        )
         raise typer.Exit(1)
 
 
+def _create_mock_runner(settings: Settings, cwd: Path) -> Runner:
+    from saha.runners.claude import MockRunner
+
+    return MockRunner()
+
+
+def _create_gemini_runner(settings: Settings, cwd: Path) -> Runner:
+    from saha.runners.gemini import GeminiRunner
+
+    return GeminiRunner(
+        model=settings.gemini_model,
+        working_dir=cwd,
+    )
+
+
+def _create_codex_runner(settings: Settings, cwd: Path) -> Runner:
+    from saha.runners.codex import CodexRunner
+
+    return CodexRunner(
+        model=settings.codex_model,
+        working_dir=cwd,
+        sandbox=settings.codex_sandbox,
+        dangerously_bypass=settings.codex_dangerously_bypass_sandbox,
+    )
+
+
+def _create_claude_runner(settings: Settings, cwd: Path) -> Runner:
+    from saha.runners.claude import ClaudeRunner
+
+    # Stream output by default for transparency during execution
+    return ClaudeRunner(
+        model=settings.claude_model,
+        working_dir=cwd,
+        stream_output=True,
+        skip_permissions=settings.claude_dangerously_skip_permissions,
+    )
+
+
+# Default runner constructors by settings.runner; anything else gets Claude
+_RUNNER_FACTORIES: dict[str, Callable[[Settings, Path], Runner]] = {
+    "mock": _create_mock_runner,
+    "gemini": _create_gemini_runner,
+    "codex": _create_codex_runner,
+    "claude": _create_claude_runner,
+}
+
+
 def _create_default_runner(settings: Settings) -> Runner:
     """Create the default runner based on settings."""
-    if settings.runner == "mock":
-        return MockRunner()
-    elif settings.runner == "gemini":
-        return GeminiRunner(
-            model=settings.gemini_model,
-            working_dir=Path.cwd(),
-        )
-    elif settings.runner == "codex":
-        return CodexRunner(
-            model=settings.codex_model,
-            working_dir=Path.cwd(),
-            sandbox=settings.codex_sandbox,
-            dangerously_bypass=settings.codex_dangerously_bypass_sandbox,
-        )
-    else:
-        return ClaudeRunner(
-            model=settings.claude_model,
-            working_dir=Path.cwd(),
-            stream_output=True,  # Stream output for transparency
-            skip_permissions=settings.claude_dangerously_skip_permissions,
-        )
+    factory = _RUNNER_FACTORIES.get(settings.runner, _create_claude_runner)
+    return factory(settings, Path.cwd())
 
 
 def _create_hook_registry(settings: Settings) -> HookRegistry:
@@ -3,6 +3,7 @@
 import logging
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -33,12 +34,20 @@ from saha.models.result import (
 from saha.models.state import ExecutionState, LoopPhase, StepStatus
 from saha.orchestrator.plan_progress import PlanProgressUpdater
 from saha.orchestrator.state import StateManager
-from saha.runners.base import Runner
+from saha.runners.base import Runner, RunnerResult
 from saha.runners.registry import RunnerRegistry
 from saha.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+# Seconds run() waits for background hook deliveries (e.g. notifications)
+_HOOK_FLUSH_TIMEOUT = 15.0
+
+# Phases after which the loop does no further work on a task
+_TERMINAL_PHASES: frozenset[LoopPhase] = frozenset(
+    {LoopPhase.COMPLETED, LoopPhase.FAILED, LoopPhase.STOPPED}
+)
+
 
 class InterruptHandler:
     """Handles interrupt signals to enable graceful shutdown."""
@@ -122,6 +131,9 @@ class AgenticLoop:
         self._hooks = hook_registry
         self._state_manager = state_manager
         self._settings = settings
+        # Settings and registry are fixed for the loop's lifetime, so resolve once
+        self._agent_runners: dict[str, Runner] = {}
+        self._agent_paths: dict[str, Path] = {}
 
     def _get_runner_for_agent(self, agent_name: str) -> Runner:
         """Get the appropriate runner for an agent.
@@ -134,9 +146,14 @@ class AgenticLoop:
         Returns:
             Runner instance to use for this agent.
         """
-        if self._runner_registry:
-            return self._runner_registry.get_runner_for_agent(agent_name)
-        return self._runner
+        runner = self._agent_runners.get(agent_name)
+        if runner is None:
+            if self._runner_registry:
+                runner = self._runner_registry.get_runner_for_agent(agent_name)
+            else:
+                runner = self._runner
+            self._agent_runners[agent_name] = runner
+        return runner
 
     def _get_agent_path(self, agent_name: str) -> Path:
         """Get the path to an agent spec, considering variants.
@@ -149,9 +166,13 @@ class AgenticLoop:
         Returns:
             Path to the agent spec file.
         """
-        normalized_name = agent_name.replace("_", "-")
-        config = self._settings.get_agent_runner_config(normalized_name)
-        return self._settings.get_agent_path(agent_name, variant=config.variant)
+        path = self._agent_paths.get(agent_name)
+        if path is None:
+            normalized_name = agent_name.replace("_", "-")
+            config = self._settings.get_agent_runner_config(normalized_name)
+            path = self._settings.get_agent_path(agent_name, variant=config.variant)
+            self._agent_paths[agent_name] = path
+        return path
 
     def run(self, config: LoopConfig) -> ExecutionState:
         """Run the agentic loop for a task.
@@ -194,6 +215,8 @@ class AgenticLoop:
                 self._state_manager.mark_failed(state, str(e))
                 self._hooks.trigger("loop_error", state=state, error=str(e))
 
+        # Let hooks that deliver in the background finish before handing back
+        self._hooks.flush(_HOOK_FLUSH_TIMEOUT)
         return state
 
     def resume(self, task_id: str) -> ExecutionState:
@@ -218,7 +241,7 @@ class AgenticLoop:
 
     def _should_continue(self, state: ExecutionState) -> bool:
         """Check if the loop should continue."""
-        if state.current_phase in (LoopPhase.COMPLETED, LoopPhase.FAILED, LoopPhase.STOPPED):
+        if state.current_phase in _TERMINAL_PHASES:
             return False
 
         if state.current_iteration >= state.max_iterations:
@@ -356,9 +379,19 @@ class AgenticLoop:
         state.last_agent_output = impl_result.output
         self._state_manager.save(state)
 
+        # Phases 2-4 only read the implementation result, so their agents may run
+        # together; each phase still applies its result to state in order below
+        critique_run: RunnerResult | None = None
+        qa_run: tuple[RunnerResult, str] | None = None
+        quality_run: RunnerResult | None = None
+        if self._settings.parallel_verification:
+            critique_run, qa_run, quality_run = self._run_verification_agents(
+                state, config, impl_result
+            )
+
         # Phase 2: Test Critique (analyze test quality before running)
         critique_result = self._run_test_critique(
-            state, config, impl_result, plan_updater, plan_phase_path
+            state, config, impl_result, plan_updater, plan_phase_path, critique_run
         )
         if not critique_result.passed:
             # Loop back with fix info - tests are hollow
@@ -387,7 +420,7 @@ class AgenticLoop:
         iteration.test_critique_passed = True
 
         # Phase 3: QA Verification
-        qa_result = self._run_qa(state, config, impl_result, plan_updater, plan_phase_path)
+        qa_result = self._run_qa(state, config, impl_result, plan_updater, plan_phase_path, qa_run)
         if not qa_result.dod_achieved:
             # Loop back with fix info
             state.context["fix_info"] = qa_result.fix_info
@@ -415,7 +448,7 @@ class AgenticLoop:
 
         # Phase 4: Code Quality
         quality_result = self._run_code_quality(
-            state, config, impl_result, plan_updater, plan_phase_path
+            state, config, impl_result, plan_updater, plan_phase_path, quality_run
         )
         if not quality_result.passed:
             # Loop back with fix info
@@ -508,11 +541,7 @@ class AgenticLoop:
             logger.warning(f"Manager update after {stopped_at_phase.value} stop failed: {exc}")
         finally:
             # Keep loop semantics stable for retries by restoring the stopped phase.
-            if state.current_phase not in (
-                LoopPhase.FAILED,
-                LoopPhase.COMPLETED,
-                LoopPhase.STOPPED,
-            ):
+            if state.current_phase not in _TERMINAL_PHASES:
                 state.current_phase = stopped_at_phase
                 self._state_manager.save(state)
 
@@ -593,6 +622,29 @@ class AgenticLoop:
                 tokens_used=result.tokens_used,
             )
 
+    def _run_verification_agents(
+        self,
+        state: ExecutionState,
+        config: LoopConfig,
+        impl_result: SubagentResult,
+    ) -> tuple[RunnerResult | None, tuple[RunnerResult, str], RunnerResult]:
+        """Run the test critique, QA and code quality agents at the same time.
+
+        Only the agent runs happen on worker threads. The phase methods apply
+        their results to state afterwards. The critique result is None when
+        its agent is not configured.
+        """
+        critique_configured = self._get_agent_path("execution_test_critique").exists()
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="saha-verify") as executor:
+            critique = (
+                executor.submit(self._invoke_test_critique, state, config, impl_result)
+                if critique_configured
+                else None
+            )
+            qa = executor.submit(self._invoke_qa, state, config, impl_result)
+            quality = executor.submit(self._invoke_code_quality, state, config, impl_result)
+        return critique.result() if critique else None, qa.result(), quality.result()
+
     def _run_test_critique(
         self,
         state: ExecutionState,
@@ -600,11 +652,13 @@ class AgenticLoop:
         impl_result: SubagentResult,
         plan_updater: PlanProgressUpdater | None,
         plan_phase_path: Path | None,
+        agent_run: RunnerResult | None = None,
     ) -> TestCritiqueResult:
         """Run test critique agent to analyze test quality before QA.
 
         This phase detects hollow tests that would give false confidence.
-        If tests are hollow (score D or F), QA should not run.
+        If tests are hollow (score D or F), QA should not run. Pass `agent_run`
+        when the agent has already been run concurrently.
         """
         self._state_manager.update_phase(state, LoopPhase.TEST_CRITIQUE)
         log_phase_start("Test Critique", config.task_id)
@@ -618,11 +672,7 @@ class AgenticLoop:
             note="test critique running",
         )
 
-        agent_name = "execution-test-critique"
         agent_path = self._get_agent_path("execution_test_critique")
-        runner = self._get_runner_for_agent(agent_name)
-        console.print(f"[cyan]→ Using runner: {runner.get_name()}[/cyan]")
-
         if not agent_path.exists():
             logger.warning(f"Test critique agent not found at {agent_path}, skipping")
             self._state_manager.complete_phase(state, LoopPhase.TEST_CRITIQUE)
@@ -642,26 +692,9 @@ class AgenticLoop:
                 summary="Test critique agent not configured, skipping",
             )
 
-        # Extract files from implementation output for focused analysis
-        files_changed = []
-        files_added = []
-        if impl_result.structured_output:
-            files_changed = impl_result.structured_output.get("files_changed", [])
-            files_added = impl_result.structured_output.get("files_added", [])
-
-        context = {
-            "task_id": config.task_id,
-            "task_path": str(config.task_path),
-            "files_changed": files_changed,
-            "files_added": files_added,
-            "iteration": state.current_iteration,
-        }
-
-        prompt = self._build_test_critique_prompt(state, config, files_changed + files_added)
-        log_agent_prompt("Test Critique", prompt)
-
-        result = runner.run_agent(agent_path, prompt, context)
-        log_token_usage("Test Critique", result.token_usage, result.tokens_used)
+        if agent_run is None:
+            agent_run = self._invoke_test_critique(state, config, impl_result)
+        result = agent_run
 
         if result.success and result.structured_output:
             critique_passed = result.structured_output.get("critique_passed", True)
@@ -728,6 +761,40 @@ class AgenticLoop:
                 summary=f"Agent error: {result.error}, proceeding with caution",
             )
 
+    def _invoke_test_critique(
+        self,
+        state: ExecutionState,
+        config: LoopConfig,
+        impl_result: SubagentResult,
+    ) -> RunnerResult:
+        """Run the test critique agent without touching loop state."""
+        agent_name = "execution-test-critique"
+        agent_path = self._get_agent_path("execution_test_critique")
+        runner = self._get_runner_for_agent(agent_name)
+        console.print(f"[cyan]→ Using runner: {runner.get_name()}[/cyan]")
+
+        # Extract files from implementation output for focused analysis
+        files_changed = []
+        files_added = []
+        if impl_result.structured_output:
+            files_changed = impl_result.structured_output.get("files_changed", [])
+            files_added = impl_result.structured_output.get("files_added", [])
+
+        context = {
+            "task_id": config.task_id,
+            "task_path": str(config.task_path),
+            "files_changed": files_changed,
+            "files_added": files_added,
+            "iteration": state.current_iteration,
+        }
+
+        prompt = self._build_test_critique_prompt(state, config, files_changed + files_added)
+        log_agent_prompt("Test Critique", prompt)
+
+        result = runner.run_agent(agent_path, prompt, context)
+        log_token_usage("Test Critique", result.token_usage, result.tokens_used)
+        return result
+
     def _build_test_critique_prompt(
         self,
         state: ExecutionState,
@@ -822,12 +889,12 @@ class AgenticLoop:
         impl_result: SubagentResult,
         plan_updater: PlanProgressUpdater | None,
         plan_phase_path: Path | None,
+        agent_run: tuple[RunnerResult, str] | None = None,
     ) -> QAResult:
         """Run the QA subagent with verification tools.
 
-        Automatically selects the Playwright-enabled variant if playwright_enabled
-        is True in the config. This keeps Playwright MCP tools out of context
-        when not needed.
+        Pass `agent_run` (agent result and pytest output) when the agent has
+        already been run concurrently.
         """
         self._state_manager.update_phase(state, LoopPhase.QA)
         log_phase_start("QA Verification", config.task_id)
@@ -841,38 +908,9 @@ class AgenticLoop:
             note="qa running",
         )
 
-        # Select agent variant based on Playwright configuration
-        agent_name = "execution-qa"
-        if config.playwright_enabled:
-            # Use Playwright-enabled variant
-            agent_path = self._settings.get_agent_path("execution_qa", variant="playwright")
-            logger.info("Using Playwright-enabled QA agent variant")
-        else:
-            # Check if there's a configured variant in settings
-            agent_path = self._get_agent_path("execution_qa")
-
-        runner = self._get_runner_for_agent(agent_name)
-        console.print(f"[cyan]→ Using runner: {runner.get_name()}[/cyan]")
-
-        context = {
-            "task_id": config.task_id,
-            "task_path": str(config.task_path),
-            "implementation_output": impl_result.output,
-            "verification_scripts": [str(s) for s in (config.verification_scripts or [])],
-            "playwright_enabled": config.playwright_enabled,
-        }
-
-        prompt = self._build_qa_prompt(state, config)
-        log_agent_prompt("QA", prompt)
-
-        result = runner.run_agent(agent_path, prompt, context)
-        log_token_usage("QA Verification", result.token_usage, result.tokens_used)
-
-        # Run pytest if enabled
-        test_output = ""
-        if "pytest" in state.enabled_tools:
-            pytest_result = self._tools.run_tool("pytest", config.task_path)
-            test_output = pytest_result.stdout
+        if agent_run is None:
+            agent_run = self._invoke_qa(state, config, impl_result)
+        result, test_output = agent_run
 
         if result.success:
             # Parse structured output for DoD status
@@ -918,6 +956,54 @@ class AgenticLoop:
                 fix_info=result.error,
             )
 
+    def _invoke_qa(
+        self,
+        state: ExecutionState,
+        config: LoopConfig,
+        impl_result: SubagentResult,
+    ) -> tuple[RunnerResult, str]:
+        """Run the QA agent and pytest without touching loop state.
+
+        Automatically selects the Playwright-enabled variant if playwright_enabled
+        is True in the config. This keeps Playwright MCP tools out of context
+        when not needed.
+
+        Returns the agent result and the pytest output.
+        """
+        # Select agent variant based on Playwright configuration
+        agent_name = "execution-qa"
+        if config.playwright_enabled:
+            # Use Playwright-enabled variant
+            agent_path = self._settings.get_agent_path("execution_qa", variant="playwright")
+            logger.info("Using Playwright-enabled QA agent variant")
+        else:
+            # Check if there's a configured variant in settings
+            agent_path = self._get_agent_path("execution_qa")
+
+        runner = self._get_runner_for_agent(agent_name)
+        console.print(f"[cyan]→ Using runner: {runner.get_name()}[/cyan]")
+
+        context = {
+            "task_id": config.task_id,
+            "task_path": str(config.task_path),
+            "implementation_output": impl_result.output,
+            "verification_scripts": [str(s) for s in (config.verification_scripts or [])],
+            "playwright_enabled": config.playwright_enabled,
+        }
+
+        prompt = self._build_qa_prompt(state, config)
+        log_agent_prompt("QA", prompt)
+
+        result = runner.run_agent(agent_path, prompt, context)
+        log_token_usage("QA Verification", result.token_usage, result.tokens_used)
+
+        # Run pytest if enabled
+        test_output = ""
+        if "pytest" in state.enabled_tools:
+            pytest_result = self._tools.run_tool("pytest", config.task_path)
+            test_output = pytest_result.stdout
+        return result, test_output
+
     def _run_code_quality(
         self,
         state: ExecutionState,
@@ -925,11 +1011,13 @@ class AgenticLoop:
         impl_result: SubagentResult,
         plan_updater: PlanProgressUpdater | None,
         plan_phase_path: Path | None,
+        agent_run: RunnerResult | None = None,
     ) -> CodeQualityResult:
         """Run code quality subagent on changed files.
 
         The Code Quality agent intelligently analyzes tool outputs,
-        filtering false positives and pre-existing issues.
+        filtering false positives and pre-existing issues. Pass `agent_run`
+        when the agent has already been run concurrently.
         """
         self._state_manager.update_phase(state, LoopPhase.CODE_QUALITY)
         log_phase_start("Code Quality", config.task_id)
@@ -943,37 +1031,9 @@ class AgenticLoop:
             note="quality running",
         )
 
-        agent_name = "execution-code-quality"
-        agent_path = self._get_agent_path("execution_code_quality")
-        runner = self._get_runner_for_agent(agent_name)
-        console.print(f"[cyan]→ Using runner: {runner.get_name()}[/cyan]")
-
-        # Extract changed files from implementation output
-        files_changed = []
-        files_added = []
-        if impl_result.structured_output:
-            files_changed = impl_result.structured_output.get("files_changed", [])
-            files_added = impl_result.structured_output.get("files_added", [])
-
-        # If no files info, fall back to checking task path
-        all_files = files_changed + files_added
-        if not all_files:
-            logger.warning("No files_changed info from implementation, will scan task path")
-
-        context = {
-            "task_id": config.task_id,
-            "task_path": str(config.task_path),
-            "files_changed": files_changed,
-            "files_added": files_added,
-            "iteration": state.current_iteration,
-            "enabled_tools": [t for t in state.enabled_tools if t in ("ruff", "ty", "complexity")],
-        }
-
-        prompt = self._build_code_quality_prompt(state, config, all_files)
-        log_agent_prompt("Code Quality", prompt)
-
-        result = runner.run_agent(agent_path, prompt, context)
-        log_token_usage("Code Quality", result.token_usage, result.tokens_used)
+        if agent_run is None:
+            agent_run = self._invoke_code_quality(state, config, impl_result)
+        result = agent_run
 
         if result.success and result.structured_output:
             quality_passed = result.structured_output.get("quality_passed", False)
@@ -1037,6 +1097,46 @@ class AgenticLoop:
                 fix_info=None,
             )
 
+    def _invoke_code_quality(
+        self,
+        state: ExecutionState,
+        config: LoopConfig,
+        impl_result: SubagentResult,
+    ) -> RunnerResult:
+        """Run the code quality agent without touching loop state."""
+        agent_name = "execution-code-quality"
+        agent_path = self._get_agent_path("execution_code_quality")
+        runner = self._get_runner_for_agent(agent_name)
+        console.print(f"[cyan]→ Using runner: {runner.get_name()}[/cyan]")
+
+        # Extract changed files from implementation output
+        files_changed = []
+        files_added = []
+        if impl_result.structured_output:
+            files_changed = impl_result.structured_output.get("files_changed", [])
+            files_added = impl_result.structured_output.get("files_added", [])
+
+        # If no files info, fall back to checking task path
+        all_files = files_changed + files_added
+        if not all_files:
+            logger.warning("No files_changed info from implementation, will scan task path")
+
+        context = {
+            "task_id": config.task_id,
+            "task_path": str(config.task_path),
+            "files_changed": files_changed,
+            "files_added": files_added,
+            "iteration": state.current_iteration,
+            "enabled_tools": [t for t in state.enabled_tools if t in ("ruff", "ty", "complexity")],
+        }
+
+        prompt = self._build_code_quality_prompt(state, config, all_files)
+        log_agent_prompt("Code Quality", prompt)
+
+        result = runner.run_agent(agent_path, prompt, context)
+        log_token_usage("Code Quality", result.token_usage, result.tokens_used)
+        return result
+
     def _build_code_quality_prompt(
         self,
         state: ExecutionState,
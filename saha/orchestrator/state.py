@@ -1,5 +1,6 @@
 """State manager for persisting execution state to YAML."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -8,6 +9,10 @@ import yaml
 
 from saha.models.state import ExecutionState, LoopPhase, StepStatus
 
+# libyaml's C parser and emitter when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class StateManager:
     """Manages execution state persistence to .sahaidachny/ directory."""
@@ -36,20 +41,37 @@ class StateManager:
 
     def load(self, task_id: str) -> ExecutionState | None:
         """Load execution state from file."""
+        state = self._read_state(task_id)
+        if state is not None:
+            self._current_state = state
+        return state
+
+    def load_many(self, task_ids: list[str]) -> list[ExecutionState | None]:
+        """Load execution states for several tasks, overlapping file I/O.
+
+        Results are returned in the order of task_ids. Unlike load(), this
+        does not change the current state.
+        """
+        if len(task_ids) <= 1:
+            return [self._read_state(task_id) for task_id in task_ids]
+
+        with ThreadPoolExecutor(max_workers=min(32, len(task_ids))) as executor:
+            return list(executor.map(self._read_state, task_ids))
+
+    def _read_state(self, task_id: str) -> ExecutionState | None:
+        """Read and validate the state file for a task."""
         state_file = self.get_state_file(task_id)
 
         if not state_file.exists():
             return None
 
         try:
-            with state_file.open() as f:
-                data = yaml.safe_load(f)
+            data = yaml.load(state_file.read_bytes(), Loader=_YAML_LOADER)
 
             if not data:
                 return None
 
-            self._current_state = ExecutionState.model_validate(data)
-            return self._current_state
+            return ExecutionState.model_validate(data)
 
         except (yaml.YAMLError, ValueError) as e:
             raise StateError(f"Failed to load state: {e}") from e
@@ -64,7 +86,7 @@ class StateManager:
             data = self._serialize_state(state)
 
             with state_file.open("w") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
             self._current_state = state
 
@@ -166,6 +188,17 @@ class StateManager:
 
         return False
 
+    def delete_many(self, task_ids: list[str]) -> list[bool]:
+        """Delete execution state for several tasks, overlapping the unlinks.
+
+        Results are returned in the order of task_ids.
+        """
+        if len(task_ids) <= 1:
+            return [self.delete(task_id) for task_id in task_ids]
+
+        with ThreadPoolExecutor(max_workers=min(16, len(task_ids))) as executor:
+            return list(executor.map(self.delete, task_ids))
+
     def _serialize_state(self, state: ExecutionState) -> dict[str, Any]:
         """Serialize state to a dict suitable for YAML."""
         data = state.model_dump(mode="json")
@@ -1,12 +1,38 @@
-"""Runner module - LLM runner implementations."""
+"""Runner module - LLM runner implementations.
+
+Backend runner classes are imported on first access, so code that only needs
+the base interfaces or the registry does not load every backend.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from saha.runners.base import Runner, RunnerResult
-from saha.runners.claude import ClaudeRunner, MockRunner
-from saha.runners.codex import CodexRunner
-from saha.runners.gemini import GeminiRunner
-from saha.runners.intelligent_mock import IntelligentMockRunner
 from saha.runners.registry import AgentConfig, RunnerRegistry, RunnerType
 
+if TYPE_CHECKING:
+    from saha.runners.claude import ClaudeRunner, MockRunner
+    from saha.runners.codex import CodexRunner
+    from saha.runners.gemini import GeminiRunner
+    from saha.runners.intelligent_mock import IntelligentMockRunner
+
+# Backend runner classes by name, mapped to the module defining them
+_LAZY_RUNNERS = {
+    "ClaudeRunner": "saha.runners.claude",
+    "MockRunner": "saha.runners.claude",
+    "CodexRunner": "saha.runners.codex",
+    "GeminiRunner": "saha.runners.gemini",
+    "IntelligentMockRunner": "saha.runners.intelligent_mock",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_RUNNERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
 __all__ = [
     "Runner",
     "RunnerResult",
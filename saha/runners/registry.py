@@ -4,6 +4,7 @@ This module provides a registry pattern for managing multiple runner backends,
 allowing different agents to use different LLM providers (Claude, Codex, Gemini, etc.).
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -54,26 +55,29 @@ class RunnerRegistry:
 
     def __init__(self) -> None:
         self._runners: dict[RunnerType, Runner] = {}
-        self._factories: dict[RunnerType, type[Runner]] = {}
+        self._factories: dict[RunnerType, Callable[..., Runner]] = {}
         self._factory_kwargs: dict[RunnerType, dict[str, Any]] = {}
         self._agent_configs: dict[str, AgentConfig] = {}
         self._default_runner_type: RunnerType = RunnerType.CLAUDE
+        # Availability probes shell out to the CLI, so each type is probed once
+        self._availability: dict[RunnerType, bool] = {}
 
     def register_factory(
         self,
         runner_type: RunnerType,
-        factory: type[Runner],
+        factory: Callable[..., Runner],
         **kwargs: Any,
     ) -> None:
         """Register a runner factory with optional configuration.
 
         Args:
             runner_type: Type identifier for this runner.
-            factory: Runner class to instantiate.
+            factory: Runner class, or callable returning a runner, to instantiate.
             **kwargs: Arguments to pass to factory when creating instance.
         """
         self._factories[runner_type] = factory
         self._factory_kwargs[runner_type] = kwargs
+        self._availability.pop(runner_type, None)
 
     def register_instance(self, runner_type: RunnerType, runner: Runner) -> None:
         """Register an already-instantiated runner.
@@ -83,6 +87,7 @@ class RunnerRegistry:
             runner: Runner instance.
         """
         self._runners[runner_type] = runner
+        self._availability.pop(runner_type, None)
 
     def configure_agent(self, config: AgentConfig) -> None:
         """Configure which runner and settings an agent should use.
@@ -121,6 +126,21 @@ class RunnerRegistry:
 
         return runner
 
+    def is_runner_available(self, runner_type: RunnerType) -> bool:
+        """Check whether a runner's backend is available, probing it at most once.
+
+        Args:
+            runner_type: Type of runner to check.
+
+        Returns:
+            True if the runner reports itself available.
+        """
+        available = self._availability.get(runner_type)
+        if available is None:
+            available = self.get_runner(runner_type).is_available()
+            self._availability[runner_type] = available
+        return available
+
     def get_runner_for_agent(self, agent_name: str) -> Runner:
         """Get the configured runner for a specific agent.
 
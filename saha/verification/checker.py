@@ -10,6 +10,7 @@ Checks include:
 
 import logging
 import re
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
@@ -36,7 +37,8 @@ class VerificationStatus(str, Enum):
     FAILED = "failed"
 
 
-class CheckResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CheckResult:
     """Result of a single verification check."""
 
     name: str
@@ -11,6 +11,7 @@ Use these tests for:
 
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -152,6 +153,19 @@ class TrackingHook(Hook):
         self._triggered_events.append(event_name)
 
 
+class OverlappingVerificationRunner(IntelligentMockRunner):
+    """Mock runner whose QA and code quality agents only finish when run together."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._barrier = threading.Barrier(2, timeout=5)
+
+    def run_agent(self, agent_spec_path, prompt, context=None, timeout=300) -> RunnerResult:
+        if agent_spec_path.stem in ("execution-qa", "execution-code-quality"):
+            self._barrier.wait()
+        return super().run_agent(agent_spec_path, prompt, context, timeout)
+
+
 @pytest.fixture
 def temp_project():
     """Create a temporary project directory with task and source files."""
@@ -535,6 +549,81 @@ class TestAgenticLoopLocal:
         # Note: fix_info might be None if not set, but the key should exist
         assert "fix_info" in second_impl_context or "iteration" in second_impl_context
 
+    def test_parallel_verification_runs_phases_together(self, temp_project, state_manager):
+        """Test that QA and code quality overlap when parallel verification is on."""
+        settings = Settings(runner="mock", parallel_verification=True)
+        runner = OverlappingVerificationRunner(working_dir=temp_project)
+
+        orchestrator = AgenticLoop(
+            runner=runner,
+            tool_registry=create_default_registry(),
+            hook_registry=HookRegistry(),
+            state_manager=state_manager,
+            settings=settings,
+        )
+
+        config = LoopConfig(
+            task_id="parallel-test",
+            task_path=Path("docs/tasks/test-task"),
+            max_iterations=3,
+            enabled_tools=[],
+        )
+
+        state = orchestrator.run(config)
+
+        assert state.current_phase.value == "completed"
+        assert state.iterations[-1].dod_achieved
+        assert state.iterations[-1].quality_passed
+
+        # Phase steps are applied on the loop thread in sequential order
+        phases = [step.phase.value for step in state.iterations[-1].steps]
+        assert phases == [
+            phase
+            for phase in (
+                "implementation",
+                "test_critique",
+                "qa",
+                "code_quality",
+                "manager",
+                "dod_check",
+            )
+            for _ in range(2)
+        ]
+
+    def test_parallel_verification_keeps_phase_priority(self, temp_project, state_manager):
+        """Test that a QA failure still stops the iteration at QA in parallel mode."""
+        settings = Settings(runner="mock", parallel_verification=True)
+        runner = IntelligentMockRunner(working_dir=temp_project, fail_qa_count=1)
+
+        orchestrator = AgenticLoop(
+            runner=runner,
+            tool_registry=create_default_registry(),
+            hook_registry=HookRegistry(),
+            state_manager=state_manager,
+            settings=settings,
+        )
+
+        config = LoopConfig(
+            task_id="parallel-priority-test",
+            task_path=Path("docs/tasks/test-task"),
+            max_iterations=3,
+            enabled_tools=[],
+        )
+
+        state = orchestrator.run(config)
+
+        assert state.current_phase.value == "completed"
+        assert state.current_iteration == 2
+        first = state.iterations[0]
+        assert not first.dod_achieved
+        assert not first.quality_passed
+        # Code quality ran alongside QA, but its result is never applied
+        assert "code_quality" not in {step.phase.value for step in first.steps}
+
+        manager_calls = [c for c in runner.call_history if c["agent_name"] == "execution-manager"]
+        stop = manager_calls[0]["context"]["iteration_stop"]
+        assert stop["stopped_at_phase"] == "qa"
+
 
 class TestIntelligentMockRunner:
     """Tests for the IntelligentMockRunner itself."""
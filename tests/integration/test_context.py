@@ -4,7 +4,8 @@ from pathlib import Path
 
 import pytest
 
-from saha.config.settings import Settings
+from saha import context as context_module
+from saha.config.settings import Settings, get_settings
 from saha.context import clear_current_task, get_current_task, resolve_task_id, set_current_task
 
 
@@ -97,6 +98,20 @@ class TestResolveTaskId:
         assert result == task_with_dir
 
 
+class TestTaskDirLookup:
+    def test_prefix_match_skips_files(self, task_settings: Settings) -> None:
+        (task_settings.task_base_path / "task-02-notes.md").write_text("# not a task")
+
+        with pytest.raises(ValueError, match="No task directory found"):
+            set_current_task("task-02", task_settings)
+
+    def test_missing_task_base_matches_nothing(self, tmp_path: Path) -> None:
+        settings = Settings(state_dir=tmp_path / ".sahaidachny", task_base_path=tmp_path / "nope")
+
+        with pytest.raises(ValueError, match="No task directory found"):
+            set_current_task("task-01", settings)
+
+
 class TestStateDir:
     def test_set_creates_state_dir_if_missing(self, tmp_path: Path) -> None:
         """set_current_task should create .sahaidachny/ if it doesn't exist."""
@@ -110,3 +125,48 @@ class TestStateDir:
 
         assert state_dir.exists()
         assert get_current_task(settings) == "task-01-feature"
+
+
+class TestContextFileCache:
+    def test_unchanged_context_file_is_not_reread(
+        self, task_settings: Settings, task_with_dir: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        set_current_task(task_with_dir, task_settings)
+        assert get_current_task(task_settings) == task_with_dir
+
+        def fail_read_text(self: Path, *args: object, **kwargs: object) -> str:
+            raise AssertionError("context file should not be reread")
+
+        monkeypatch.setattr(Path, "read_text", fail_read_text)
+
+        assert get_current_task(task_settings) == task_with_dir
+
+    def test_external_rewrite_is_picked_up(
+        self, task_settings: Settings, task_with_dir: str
+    ) -> None:
+        (task_settings.task_base_path / "task-02-other").mkdir()
+        set_current_task(task_with_dir, task_settings)
+        assert get_current_task(task_settings) == task_with_dir
+
+        (task_settings.state_dir / "current-task").write_text("task-02-other")
+
+        assert get_current_task(task_settings) == "task-02-other"
+
+
+class TestDefaultSettings:
+    def test_defaults_come_from_cached_settings(
+        self, task_settings: Settings, task_with_dir: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(context_module, "get_settings", lambda: task_settings)
+
+        set_current_task(task_with_dir)
+
+        assert get_current_task() == task_with_dir
+        assert resolve_task_id(None) == task_with_dir
+
+    def test_get_settings_is_constructed_once(self) -> None:
+        get_settings.cache_clear()
+        try:
+            assert get_settings() is get_settings()
+        finally:
+            get_settings.cache_clear()
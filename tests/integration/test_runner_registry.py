@@ -42,3 +42,37 @@ def test_cli_default_runner_updates_all_agents() -> None:
     assert settings.agents.code_quality.runner == "codex"
     assert settings.agents.manager.runner == "codex"
     assert settings.agents.dod.runner == "codex"
+
+
+def test_cli_overrides_combine_runner_qa_runner_and_permissions() -> None:
+    settings = _build_run_settings(
+        verbose=False,
+        dry_run=True,
+        qa_runner="gemini",
+        default_runner="codex",
+        dangerously_skip_permissions=True,
+    )
+
+    assert settings.dry_run is True
+    assert settings.runner == "codex"
+    assert settings.agents.default_runner == "codex"
+    assert settings.agents.implementer.runner == "codex"
+    assert settings.agents.qa.runner == "gemini"
+    assert settings.claude_dangerously_skip_permissions is True
+    assert settings.codex_dangerously_bypass_sandbox is True
+
+    registry = create_runner_registry(settings)
+    assert isinstance(registry.get_runner_for_agent("execution-implementer"), CodexRunner)
+
+
+def test_agent_config_lookup_normalizes_names() -> None:
+    agents = AgentsConfig(
+        default_runner="gemini",
+        code_quality=AgentRunnerConfig(runner="codex"),
+    )
+
+    assert agents.get_config("execution-code-quality").runner == "codex"
+    assert agents.get_config("code-quality").runner == "codex"
+    # Unknown agents and non-agent fields fall back to the default runner
+    assert agents.get_config("execution-reviewer").runner == "gemini"
+    assert agents.get_config("default-runner").runner == "gemini"
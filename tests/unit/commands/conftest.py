@@ -0,0 +1,35 @@
+"""Shared fixtures for CLI command unit tests."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from saha.commands import plugin
+from saha.config.settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep sync fingerprints written by commands out of the real ~/.cache."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture(autouse=True)
+def fresh_default_settings() -> Iterator[None]:
+    """Re-read settings per test so env and cwd changes are picked up."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_plugin_path() -> Iterator[None]:
+    """Re-run the plugin and CLI lookups per test so cwd and PATH changes are picked up."""
+    plugin.reset_plugin_path_cache()
+    plugin._resolve_cli.cache_clear()
+    yield
+    plugin.reset_plugin_path_cache()
+    plugin._resolve_cli.cache_clear()
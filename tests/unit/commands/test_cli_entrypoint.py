@@ -0,0 +1,25 @@
+"""Unit tests for the saha CLI entry point fast paths."""
+
+import sys
+
+import pytest
+
+from saha import __version__, cli
+
+
+@pytest.mark.parametrize("argv", [["saha", "version"], ["saha", "--version"]])
+def test_version_is_answered_without_building_app(
+    argv: list[str], monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(sys, "argv", argv)
+    monkeypatch.setattr(cli, "create_app", lambda: pytest.fail("app should not be built"))
+
+    cli.main()
+
+    assert capsys.readouterr().out == f"saha version {__version__}\n"
+
+
+def test_app_attribute_is_built_once() -> None:
+    assert cli.app is cli.create_app()
+    names = {c.name or c.callback.__name__ for c in cli.app.registered_commands}
+    assert names >= {"run", "version", "sync"}
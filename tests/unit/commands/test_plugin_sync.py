@@ -1,8 +1,11 @@
 """Unit tests for multi-CLI artifact sync helpers."""
 
+import errno
+import os
 from pathlib import Path
 
 import pytest
+import typer
 
 from saha.commands import plugin as plugin_module
 from saha.commands.plugin import sync_artifacts
@@ -101,3 +104,309 @@ def test_sync_claude_artifacts_refreshes_changed_agent(
 
     assert "execution-qa.md" in result.agents_synced
     assert (claude_dir / "agents" / "execution-qa.md").read_text() == "# qa"
+
+
+def test_sync_claude_artifacts_skips_when_nothing_changed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    claude_dir = tmp_path / "workspace" / ".claude"
+    monkeypatch.setattr(plugin_module, "_find_plugin_path", lambda: plugin)
+
+    first = plugin_module.sync_claude_artifacts(claude_dir)
+    assert first.agents_synced == ["execution-qa.md"]
+
+    def fail_sync(*args: object, **kwargs: object) -> bool:
+        raise AssertionError("unchanged agents should not be re-synced")
+
+    monkeypatch.setattr(plugin_module, "_sync_file", fail_sync)
+    second = plugin_module.sync_claude_artifacts(claude_dir)
+
+    assert second.total_synced == 0
+
+
+def test_sync_claude_artifacts_resyncs_locally_edited_agent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    claude_dir = tmp_path / "workspace" / ".claude"
+    monkeypatch.setattr(plugin_module, "_find_plugin_path", lambda: plugin)
+    plugin_module.sync_claude_artifacts(claude_dir)
+
+    (claude_dir / "agents" / "execution-qa.md").write_text("# locally edited")
+    result = plugin_module.sync_claude_artifacts(claude_dir)
+
+    assert result.agents_synced == ["execution-qa.md"]
+    assert (claude_dir / "agents" / "execution-qa.md").read_text() == "# qa"
+
+
+def test_force_sync_compares_content_when_only_mtime_differs(tmp_path: Path) -> None:
+    source = tmp_path / "source.md"
+    target = tmp_path / "target.md"
+    source.write_text("# same")
+    target.write_text("# same")
+    os.utime(target, ns=(0, 0))
+
+    assert plugin_module._should_copy_file(source, target, force=True) is False
+
+    target.write_text("# diff")
+    os.utime(target, ns=(0, 0))
+
+    assert plugin_module._should_copy_file(source, target, force=True) is True
+
+
+def test_force_sync_hashes_each_source_once_across_targets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(plugin_module, "_SOURCE_DIGESTS", {})
+    source = tmp_path / "source.md"
+    source.write_text("# plugin")
+    targets = [tmp_path / f"target-{i}.md" for i in range(3)]
+    for target in targets:
+        target.write_text("# plugin")
+        os.utime(target, ns=(0, 0))
+
+    hashed: list[Path] = []
+    file_digest = plugin_module._file_digest
+
+    def counting_digest(path: Path) -> bytes:
+        hashed.append(path)
+        return file_digest(path)
+
+    monkeypatch.setattr(plugin_module, "_file_digest", counting_digest)
+
+    for target in targets:
+        assert plugin_module._should_copy_file(source, target, force=True) is False
+
+    assert hashed.count(source) == 1
+
+
+def test_iter_plugin_artifacts_classifies_files(tmp_path: Path) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    (plugin / "commands" / "notes.txt").write_text("not a command")
+    (plugin / "README.md").write_text("# not synced")
+
+    artifacts = {(c, rel) for c, rel, _ in plugin_module._iter_plugin_artifacts(plugin)}
+
+    assert artifacts == {
+        ("commands", "research.md"),
+        ("commands", "saha.md"),
+        ("agents", "execution-qa.md"),
+        ("skills", "task-structure/SKILL.md"),
+        ("templates", "task.md"),
+        ("scripts", "init.sh"),
+        ("settings", "settings.json"),
+    }
+
+
+def test_large_directory_tree_is_synced_in_sorted_order(tmp_path: Path) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    names = [f"skill-{i:02d}.md" for i in range(12)]
+    for name in reversed(names):
+        (plugin / "skills" / name).write_text(f"# {name}")
+    workspace = tmp_path / "workspace"
+
+    result = sync_artifacts(target="codex", plugin_path=plugin, base_dir=workspace)
+
+    skills = [path for path in result.results[0].files_synced if path.startswith("skills/")]
+    assert skills == sorted(skills)
+    assert all((workspace / ".codex" / "skills" / name).exists() for name in names)
+
+
+def test_synced_files_keep_source_mtime_and_executable_bits(tmp_path: Path) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    script = plugin / "scripts" / "init.sh"
+    script.chmod(0o755)
+    workspace = tmp_path / "workspace"
+
+    sync_artifacts(target="codex", plugin_path=plugin, base_dir=workspace)
+
+    synced_template = workspace / ".codex" / "templates" / "task.md"
+    synced_script = workspace / ".codex" / "scripts" / "init.sh"
+    source_template = plugin / "templates" / "task.md"
+    assert synced_template.stat().st_mtime_ns == source_template.stat().st_mtime_ns
+    assert os.access(synced_script, os.X_OK)
+
+
+def test_claude_sync_removes_legacy_command_files(tmp_path: Path) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    commands_dir = tmp_path / "workspace" / ".claude" / "commands"
+    commands_dir.mkdir(parents=True)
+    (commands_dir / "research.md").symlink_to(plugin / "commands" / "research.md")
+    (commands_dir / "sahaidachny:research.md").write_text("# old prefix")
+    (commands_dir / "sahaidachny.md").write_text("# old help")
+    (commands_dir / "custom.md").write_text("# user command")
+
+    sync_artifacts(target="claude", plugin_path=plugin, base_dir=tmp_path / "workspace")
+
+    assert sorted(p.name for p in commands_dir.iterdir()) == [
+        "custom.md",
+        "saha.md",
+        "saha:research.md",
+    ]
+
+
+def test_force_sync_size_mismatch_copies_without_reading_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "source.md"
+    target = tmp_path / "target.md"
+    source.write_text("# plugin version")
+    target.write_text("# edited")
+
+    def fail_digest(path: Path) -> bytes:
+        raise AssertionError("files of different sizes should not be read")
+
+    monkeypatch.setattr(plugin_module, "_file_digest", fail_digest)
+
+    assert plugin_module._should_copy_file(source, target, force=True) is True
+
+
+def test_run_cli_replaces_process_on_posix(monkeypatch: pytest.MonkeyPatch) -> None:
+    class ExecCalled(Exception):
+        pass
+
+    def fake_execv(path: str, argv: list[str]) -> None:
+        raise ExecCalled(path, argv)
+
+    monkeypatch.setattr(plugin_module.sys, "platform", "linux")
+    monkeypatch.setattr(plugin_module.os, "execv", fake_execv)
+
+    with pytest.raises(ExecCalled) as exc_info:
+        plugin_module._run_cli("/usr/bin/codex", ["--help"])
+
+    assert exc_info.value.args == ("/usr/bin/codex", ["/usr/bin/codex", "--help"])
+
+
+def test_run_cli_reports_exec_failure(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    def failing_execv(path: str, argv: list[str]) -> None:
+        raise PermissionError(errno.EACCES, "Permission denied", path)
+
+    monkeypatch.setattr(plugin_module.sys, "platform", "linux")
+    monkeypatch.setattr(plugin_module.os, "execv", failing_execv)
+
+    with pytest.raises(typer.Exit) as exc_info:
+        plugin_module._run_cli("/usr/bin/codex")
+
+    assert exc_info.value.exit_code == 1
+    assert capsys.readouterr().err == "Error: failed to run /usr/bin/codex: Permission denied\n"
+
+
+def test_sync_walks_the_plugin_once_for_all_targets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    walks: list[Path] = []
+    real_walk = plugin_module._iter_plugin_artifacts
+
+    def counting_walk(plugin_path: Path):
+        walks.append(plugin_path)
+        return real_walk(plugin_path)
+
+    monkeypatch.setattr(plugin_module, "_iter_plugin_artifacts", counting_walk)
+
+    result = sync_artifacts(target="all", plugin_path=plugin, base_dir=tmp_path / "workspace")
+
+    assert walks == [plugin]
+    assert [r.total_synced for r in result.results] == [7, 7, 7]
+
+
+def test_symlink_merge_skips_dangling_links_and_replaces_symlinked_dir(tmp_path: Path) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    claude_dir = tmp_path / ".claude"
+    templates_dst = claude_dir / "templates"
+    templates_dst.mkdir(parents=True)
+    (templates_dst / "task.md").symlink_to(tmp_path / "missing.md")
+
+    plugin_module._symlink_plugin_directory(str(plugin / "templates"), str(templates_dst))
+    assert os.readlink(templates_dst / "task.md") == str(tmp_path / "missing.md")
+
+    scripts_dst = claude_dir / "scripts"
+    scripts_dst.symlink_to(tmp_path / "elsewhere")
+    plugin_module._symlink_plugin_directory(str(plugin / "scripts"), str(scripts_dst))
+    assert scripts_dst.resolve() == (plugin / "scripts").resolve()
+
+
+def test_plugin_path_is_cached_until_reset(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(plugin_module.importlib.util, "find_spec", lambda name: None)
+    monkeypatch.setattr(plugin_module.Path, "home", lambda: tmp_path / "home")
+    monkeypatch.chdir(tmp_path)
+    plugin = _create_plugin_tree(tmp_path)
+
+    assert plugin_module._find_plugin_path() == plugin
+    (plugin / "commands").rename(tmp_path / "moved")
+    assert plugin_module._find_plugin_path() == plugin
+
+    plugin_module.reset_plugin_path_cache()
+    assert plugin_module._find_plugin_path() != plugin
+
+
+def test_fast_copy_falls_back_when_copy_file_range_is_unsupported(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "init.sh"
+    source.write_text("#!/usr/bin/env bash\necho init\n")
+    source.chmod(0o755)
+    os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+
+    def unsupported(*args: object) -> int:
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr(plugin_module.os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(plugin_module, "_HAS_COPY_FILE_RANGE", True)
+
+    target = tmp_path / "copy.sh"
+    plugin_module._fast_copy(str(source), str(target), os.stat(source))
+
+    assert target.read_text() == source.read_text()
+    assert os.stat(target).st_mode & 0o777 == 0o755
+    assert os.stat(target).st_mtime_ns == 1_000_000_000
+
+
+def test_show_plugin_contents_lists_sorted_entries_with_counts(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    (plugin / "agents" / "execution-dod.md").write_text("# dod")
+
+    plugin_module._show_plugin_contents(plugin)
+
+    listing = [line.strip() for line in capsys.readouterr().out.splitlines() if line[:2] == "  "]
+    assert listing == [
+        "agents/ (2 files)",
+        "commands/ (2 files)",
+        "scripts/ (1 files)",
+        "settings.json",
+        "skills/ (1 files)",
+        "templates/ (1 files)",
+    ]
+
+
+def test_copy_to_target_copies_nested_trees_once(tmp_path: Path) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    (plugin / "skills" / "task-structure" / "refs").mkdir()
+    (plugin / "skills" / "task-structure" / "refs" / "guide.md").write_text("# guide")
+    target = tmp_path / "copy"
+
+    first = plugin_module._copy_plugin_to_target(plugin, target)
+    second = plugin_module._copy_plugin_to_target(plugin, target)
+
+    assert first == 7
+    assert second == 0
+    assert (target / "skills" / "task-structure" / "refs" / "guide.md").read_text() == "# guide"
+    assert (target / "commands" / "saha:research.md").exists()
+
+
+def test_claude_command_setup_migrates_legacy_names(tmp_path: Path) -> None:
+    plugin = _create_plugin_tree(tmp_path)
+    commands_dst = tmp_path / ".claude" / "commands"
+    commands_dst.mkdir(parents=True)
+    (commands_dst / "sahaidachny.md").write_text("# old help")
+    (commands_dst / "sahaidachny:research.md").write_text("# old research")
+    (commands_dst / "research.md").symlink_to(plugin / "commands" / "research.md")
+
+    plugin_module._setup_commands_for_claude(str(plugin / "commands"), str(commands_dst))
+
+    assert sorted(p.name for p in commands_dst.iterdir()) == ["saha.md", "saha:research.md"]
@@ -0,0 +1,20 @@
+"""Unit tests for run command option parsing."""
+
+import pytest
+
+from saha.commands import execution
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("ruff", ["ruff"]),
+        ("ruff, ty ,pytest", ["ruff", "ty", "pytest"]),
+        ("ruff,,", ["ruff"]),
+        (" , ", None),
+    ],
+)
+def test_parse_tools(raw: str | None, expected: list[str] | None) -> None:
+    assert execution._parse_tools(raw) == expected
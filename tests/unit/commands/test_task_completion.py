@@ -0,0 +1,67 @@
+"""Unit tests for task ID shell completion."""
+
+from pathlib import Path
+
+import pytest
+
+from saha.commands import execution
+
+
+@pytest.fixture
+def task_base(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    base = tmp_path / "docs" / "tasks"
+    (base / "task-01-auth").mkdir(parents=True)
+    (base / "task-02-billing").mkdir()
+    (base / "notes.md").write_text("# not a task")
+    monkeypatch.chdir(tmp_path)
+    return base
+
+
+def test_completes_task_dirs_by_prefix(task_base: Path) -> None:
+    assert sorted(execution._complete_task_id("")) == ["task-01-auth", "task-02-billing"]
+    assert execution._complete_task_id("task-02") == ["task-02-billing"]
+
+
+def test_missing_task_base_completes_nothing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    assert execution._complete_task_id("task") == []
+
+
+def test_new_task_dir_is_completed(task_base: Path) -> None:
+    execution._complete_task_id("")
+    (task_base / "task-03-search").mkdir()
+
+    assert execution._complete_task_id("task-03") == ["task-03-search"]
+
+
+def test_default_task_base_constant_mirrors_settings_field() -> None:
+    from saha.config.settings import Settings
+
+    default = Settings.model_fields["task_base_path"].default
+    assert Path(execution._DEFAULT_TASK_BASE_PATH) == default
+
+
+def test_fast_task_base_default_matches_settings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from saha.config.settings import Settings
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SAHA_TASK_BASE_PATH", raising=False)
+
+    assert execution._task_base_path_fast() == Settings().task_base_path
+
+
+def test_fast_task_base_honours_env_and_dotenv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("saha_task_base_path", "custom/tasks")
+    assert execution._task_base_path_fast() == Path("custom/tasks")
+
+    monkeypatch.delenv("saha_task_base_path")
+    (tmp_path / ".env").write_text("SAHA_TASK_BASE_PATH=from/dotenv\n")
+    assert execution._task_base_path_fast() == Path("from/dotenv")
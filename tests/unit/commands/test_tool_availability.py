@@ -0,0 +1,41 @@
+"""Unit tests for cached tool availability probing."""
+
+import pytest
+
+from saha.commands import execution
+
+
+class CountingTool:
+    def __init__(self, name: str, available: bool) -> None:
+        self.name = name
+        self.available = available
+        self.probes = 0
+
+    def is_available(self) -> bool:
+        self.probes += 1
+        return self.available
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(execution, "_AVAILABILITY_CACHE", {})
+
+
+def test_availability_is_probed_once_within_ttl() -> None:
+    tools = [CountingTool("ruff", True), CountingTool("ty", False)]
+
+    assert execution._tool_availability(tools) == [True, False]
+    assert execution._tool_availability(tools) == [True, False]
+    assert [tool.probes for tool in tools] == [1, 1]
+
+
+def test_expired_availability_is_reprobed(monkeypatch: pytest.MonkeyPatch) -> None:
+    tool = CountingTool("ruff", True)
+    execution._tool_availability([tool])
+
+    tool.available = False
+    now = execution.time.monotonic() + execution._TOOL_AVAILABILITY_TTL + 1
+    monkeypatch.setattr(execution.time, "monotonic", lambda: now)
+
+    assert execution._tool_availability([tool]) == [False]
+    assert tool.probes == 2
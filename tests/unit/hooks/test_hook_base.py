@@ -0,0 +1,51 @@
+"""Unit tests for hook event filtering."""
+
+from typing import Any
+
+from saha.hooks.base import Hook, HookEvent
+
+
+class _RecordingHook(Hook):
+    def __init__(self, events: list[HookEvent]) -> None:
+        self._events = events
+        self.events_reads = 0
+
+    @property
+    def name(self) -> str:
+        return "recording"
+
+    @property
+    def events(self) -> list[HookEvent]:
+        self.events_reads += 1
+        return self._events
+
+    def execute(self, event: HookEvent, **kwargs: Any) -> None:
+        pass
+
+
+def test_hook_without_events_triggers_on_everything() -> None:
+    hook = _RecordingHook([])
+
+    assert all(hook.should_trigger(event) for event in HookEvent)
+
+
+def test_hook_events_are_read_once() -> None:
+    hook = _RecordingHook([HookEvent.LOOP_COMPLETE, HookEvent.LOOP_FAILED])
+
+    assert hook.should_trigger(HookEvent.LOOP_FAILED)
+    assert not hook.should_trigger(HookEvent.QA_START)
+    assert hook.events_reads == 1
+
+
+def test_hook_events_compare_and_format_as_plain_strings() -> None:
+    assert HookEvent.LOOP_START == "loop_start"
+    assert f"{HookEvent.QA_FAILED}" == "qa_failed"
+    assert HookEvent("loop_complete") is HookEvent.LOOP_COMPLETE
+
+
+def test_builtin_hooks_have_no_instance_dict() -> None:
+    from saha.hooks.notification import LoggingHook, NtfyHook
+    from saha.hooks.registry import HookRegistry
+
+    for instance in (LoggingHook(), NtfyHook(topic="saha-test", enabled=False), HookRegistry()):
+        assert not hasattr(instance, "__dict__")
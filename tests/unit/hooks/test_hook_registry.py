@@ -0,0 +1,72 @@
+"""Unit tests for hook registration and dispatch."""
+
+from typing import Any
+
+import pytest
+
+from saha.hooks.base import Hook, HookEvent
+from saha.hooks.registry import HookRegistry
+
+
+class _CollectingHook(Hook):
+    def __init__(self, name: str, events: list[HookEvent], calls: list[tuple[str, str]]) -> None:
+        self._name = name
+        self._events = events
+        self._calls = calls
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def events(self) -> list[HookEvent]:
+        return self._events
+
+    def execute(self, event: HookEvent, **kwargs: Any) -> None:
+        self._calls.append((self._name, event))
+
+
+@pytest.fixture
+def calls() -> list[tuple[str, str]]:
+    return []
+
+
+@pytest.fixture
+def registry(calls: list[tuple[str, str]]) -> HookRegistry:
+    registry = HookRegistry()
+    registry.register(_CollectingHook("all", [], calls))
+    registry.register(_CollectingHook("done", [HookEvent.LOOP_COMPLETE], calls))
+    return registry
+
+
+def test_trigger_dispatches_to_listeners_in_registration_order(
+    registry: HookRegistry, calls: list[tuple[str, str]]
+) -> None:
+    registry.trigger("loop_complete")
+    registry.trigger(HookEvent.QA_START)
+
+    assert calls == [
+        ("all", HookEvent.LOOP_COMPLETE),
+        ("done", HookEvent.LOOP_COMPLETE),
+        ("all", HookEvent.QA_START),
+    ]
+    assert all(type(event) is HookEvent for _, event in calls)
+
+
+def test_unknown_event_is_ignored(registry: HookRegistry, calls: list[tuple[str, str]]) -> None:
+    registry.trigger("not_an_event")
+
+    assert calls == []
+
+
+def test_unregister_and_clear_stop_dispatch(
+    registry: HookRegistry, calls: list[tuple[str, str]]
+) -> None:
+    assert registry.unregister("done")
+    registry.trigger("loop_complete")
+    assert calls == [("all", HookEvent.LOOP_COMPLETE)]
+
+    registry.clear()
+    registry.trigger("loop_complete")
+    assert len(calls) == 1
+    assert registry.list_hooks() == []
@@ -0,0 +1,412 @@
+"""Unit tests for the ntfy notification and logging hooks."""
+
+import logging
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from saha.hooks import notification
+from saha.hooks.base import HookEvent
+from saha.hooks.notification import LoggingHook, NtfyHook
+from saha.models.state import ExecutionState, IterationRecord, LoopPhase, StepRecord, StepStatus
+
+
+class _NtfyServer(ThreadingHTTPServer):
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _NtfyHandler)
+        self.connections = 0
+        self.drop_idle_connections = False
+        self.statuses: list[int] = []
+        self.requests: list[tuple[str, dict[str, str], bytes]] = []
+
+
+class _NtfyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _NtfyServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append((self.path, dict(self.headers), body))
+        self.send_response(self.server.statuses.pop(0) if self.server.statuses else 200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        # Close without announcing it, like a server reaping idle keep-alive connections
+        self.close_connection = self.server.drop_idle_connections
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    server: _NtfyServer
+
+    def do_CONNECT(self) -> None:
+        self.server.requests.append((self.path, dict(self.headers), b""))
+        self.send_response(403)
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_proxy_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("http_proxy", "https_proxy", "no_proxy", "all_proxy"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+
+
+@pytest.fixture
+def ntfy_server() -> Iterator[_NtfyServer]:
+    server = _NtfyServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _hook(server: _NtfyServer, **kwargs: str) -> NtfyHook:
+    host, port = server.server_address[:2]
+    return NtfyHook(topic="saha-test", server=f"http://{host}:{port}/", **kwargs)
+
+
+def test_consecutive_sends_reuse_one_connection(ntfy_server: _NtfyServer) -> None:
+    hook = _hook(ntfy_server)
+    try:
+        assert hook._send("Task Completed: t1", "done", "default", "robot")
+        assert hook._send("Task Failed: t2", "failed", "high", "x")
+    finally:
+        hook.close()
+
+    assert ntfy_server.connections == 1
+    assert [(path, body) for path, _, body in ntfy_server.requests] == [
+        ("/saha-test", b"done"),
+        ("/saha-test", b"failed"),
+    ]
+    assert ntfy_server.requests[1][1]["Priority"] == "high"
+
+
+def test_send_reconnects_after_server_drops_connection(
+    ntfy_server: _NtfyServer, caplog: pytest.LogCaptureFixture
+) -> None:
+    ntfy_server.drop_idle_connections = True
+    hook = _hook(ntfy_server, token="secret")
+    try:
+        hook.execute(HookEvent.LOOP_COMPLETE)
+        hook.flush(timeout=5)
+        hook.execute(HookEvent.LOOP_FAILED)
+        hook.flush(timeout=5)
+    finally:
+        hook.close()
+
+    assert "Failed to send notification" not in caplog.text
+    assert ntfy_server.connections == 2
+    assert len(ntfy_server.requests) == 2
+    assert ntfy_server.requests[1][1]["Authorization"] == "Bearer secret"
+
+
+def test_non_ascii_title_is_replaced_for_the_header(ntfy_server: _NtfyServer) -> None:
+    hook = _hook(ntfy_server)
+    try:
+        assert hook._send("Task Completed: завдання", "done", "default", "robot")
+    finally:
+        hook.close()
+
+    assert ntfy_server.requests[0][1]["Title"] == "Task Completed: ????????"
+
+
+@pytest.fixture
+def backoff_sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    sleeps: list[float] = []
+    monkeypatch.setattr(notification.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_unreachable_server_reports_failure(
+    backoff_sleeps: list[float], caplog: pytest.LogCaptureFixture
+) -> None:
+    hook = NtfyHook(topic="saha-test", server="http://127.0.0.1:9")
+    try:
+        hook.execute(HookEvent.LOOP_COMPLETE)
+        hook.flush(timeout=5)
+        assert hook._connection is None
+    finally:
+        hook.close()
+
+    assert "Failed to send notification" in caplog.text
+    assert len(backoff_sleeps) == 2
+    assert backoff_sleeps[1] > backoff_sleeps[0]
+
+
+def test_server_errors_are_retried_with_backoff(
+    ntfy_server: _NtfyServer, backoff_sleeps: list[float]
+) -> None:
+    ntfy_server.statuses = [503, 502]
+    hook = _hook(ntfy_server)
+    try:
+        hook.execute(HookEvent.LOOP_COMPLETE)
+        hook.flush(timeout=5)
+    finally:
+        hook.close()
+
+    assert hook._last_send is not None and hook._last_send.result() is True
+    assert len(ntfy_server.requests) == 3
+    assert len(backoff_sleeps) == 2
+
+
+def test_client_errors_are_not_retried(
+    ntfy_server: _NtfyServer, backoff_sleeps: list[float]
+) -> None:
+    ntfy_server.statuses = [403]
+    hook = _hook(ntfy_server)
+    try:
+        hook.execute(HookEvent.LOOP_COMPLETE)
+        hook.flush(timeout=5)
+    finally:
+        hook.close()
+
+    assert hook._last_send is not None and hook._last_send.result() is False
+
+    assert len(ntfy_server.requests) == 1
+    assert backoff_sleeps == []
+
+
+def test_execute_queues_send_and_flush_waits_for_it(
+    ntfy_server: _NtfyServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hook = _hook(ntfy_server)
+    release = threading.Event()
+    real_send = NtfyHook._send
+
+    def slow_send(self: NtfyHook, *args: Any) -> bool:
+        release.wait(5)
+        return real_send(self, *args)
+
+    monkeypatch.setattr(NtfyHook, "_send", slow_send)
+    try:
+        hook.execute(HookEvent.LOOP_COMPLETE)
+        hook.execute(HookEvent.LOOP_FAILED)
+        assert ntfy_server.requests == []
+
+        release.set()
+        hook.flush(timeout=5)
+        assert [headers["Title"] for _, headers, _ in ntfy_server.requests] == [
+            "Task Completed: unknown",
+            "Task Failed: unknown",
+        ]
+    finally:
+        hook.close()
+
+
+def test_failed_send_keeps_the_worker_running(
+    ntfy_server: _NtfyServer, backoff_sleeps: list[float]
+) -> None:
+    hook = NtfyHook(topic="saha-test", server="http://127.0.0.1:1")
+    try:
+        hook.execute(HookEvent.LOOP_COMPLETE)
+        hook.flush(timeout=5)
+        assert hook._executor is not None
+
+        # Point the same hook at a live server; the worker must still accept sends
+        host, port = ntfy_server.server_address[:2]
+        hook._host = f"{host}:{port}"
+        hook.execute(HookEvent.LOOP_FAILED)
+        hook.flush(timeout=5)
+    finally:
+        hook.close()
+
+    assert [headers["Title"] for _, headers, _ in ntfy_server.requests] == ["Task Failed: unknown"]
+
+
+def test_https_is_tunnelled_through_the_proxy(
+    monkeypatch: pytest.MonkeyPatch, backoff_sleeps: list[float]
+) -> None:
+    proxy = _NtfyServer()
+    proxy.RequestHandlerClass = _ProxyHandler
+    thread = threading.Thread(target=proxy.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    host, port = proxy.server_address[:2]
+    monkeypatch.setenv("HTTPS_PROXY", f"http://saha:s3cret@{host}:{port}")
+    hook = NtfyHook(topic="saha-test", server="https://ntfy.invalid")
+    try:
+        hook.execute(HookEvent.LOOP_COMPLETE)
+        hook.flush(timeout=5)
+    finally:
+        hook.close()
+        proxy.shutdown()
+        proxy.server_close()
+
+    path, headers, _ = proxy.requests[0]
+    assert path == "ntfy.invalid:443"
+    assert headers["Proxy-Authorization"] == "Basic c2FoYTpzM2NyZXQ="
+
+
+def test_http_is_forwarded_by_the_proxy(
+    ntfy_server: _NtfyServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    host, port = ntfy_server.server_address[:2]
+    monkeypatch.setenv("HTTP_PROXY", f"http://{host}:{port}")
+    hook = NtfyHook(topic="saha-test", server="http://ntfy.invalid")
+    try:
+        hook.execute(HookEvent.LOOP_COMPLETE)
+        hook.flush(timeout=5)
+    finally:
+        hook.close()
+
+    path, headers, _ = ntfy_server.requests[0]
+    assert path == "http://ntfy.invalid/saha-test"
+    assert headers["Host"] == "ntfy.invalid"
+
+
+def test_no_proxy_hosts_are_reached_directly(
+    ntfy_server: _NtfyServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    hook = _hook(ntfy_server)
+    try:
+        hook.execute(HookEvent.LOOP_COMPLETE)
+        hook.flush(timeout=5)
+    finally:
+        hook.close()
+
+    assert [path for path, _, _ in ntfy_server.requests] == ["/saha-test"]
+
+
+def test_exit_handler_is_registered_only_while_sends_can_be_queued(
+    ntfy_server: _NtfyServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    registered: list[Any] = []
+    monkeypatch.setattr(notification.atexit, "register", registered.append)
+    monkeypatch.setattr(notification.atexit, "unregister", registered.remove)
+    hook = _hook(ntfy_server)
+    assert registered == []
+
+    hook.execute(HookEvent.LOOP_COMPLETE)
+    hook.execute(HookEvent.LOOP_FAILED)
+    assert registered == [hook.close]
+
+    hook.close()
+    assert registered == []
+    assert len(ntfy_server.requests) == 2
+
+
+def test_disabled_hook_queues_nothing(ntfy_server: _NtfyServer) -> None:
+    host, port = ntfy_server.server_address[:2]
+    hook = NtfyHook(topic="saha-test", server=f"http://{host}:{port}", enabled=False)
+
+    hook.execute(HookEvent.LOOP_COMPLETE)
+    hook.flush()
+
+    assert hook._executor is None
+    assert ntfy_server.requests == []
+
+
+def test_basic_auth_header_is_sent(ntfy_server: _NtfyServer) -> None:
+    hook = _hook(ntfy_server, user="saha", password="s3cret")
+    try:
+        assert hook._send("title", "message", "default", "robot")
+    finally:
+        hook.close()
+
+    assert ntfy_server.requests[0][1]["Authorization"] == "Basic c2FoYTpzM2NyZXQ="
+
+
+@pytest.fixture
+def finished_state() -> ExecutionState:
+    iteration = IterationRecord(
+        iteration=1,
+        started_at=datetime(2026, 1, 1),
+        steps=[StepRecord(phase=LoopPhase.QA, status=StepStatus.COMPLETED)],
+        dod_achieved=True,
+    )
+    return ExecutionState(
+        task_id="task-01",
+        task_path=Path("docs/tasks/task-01"),
+        current_iteration=1,
+        iterations=[iteration],
+    )
+
+
+def test_notifications_use_event_templates(finished_state: ExecutionState) -> None:
+    hook = NtfyHook(topic="saha-test", enabled=False)
+
+    title, message, priority, tags = hook._build_notification(
+        HookEvent.LOOP_COMPLETE, finished_state, None
+    )
+    assert (title, priority, tags) == (
+        "Task Completed: task-01",
+        "default",
+        "white_check_mark,robot",
+    )
+    assert message == "  Done: Qa\n\nDoD: PASSED"
+
+    assert hook._build_notification(HookEvent.LOOP_ERROR, finished_state, "boom") == (
+        "Task Error: task-01",
+        "An error occurred after 1 iteration(s). Check logs for details.",
+        "urgent",
+        "warning,rotating_light",
+    )
+    assert hook._build_notification(HookEvent.QA_START, None, None) == (
+        "Task Update: unknown",
+        "Event: qa_start",
+        "default",
+        "robot",
+    )
+
+
+def test_iteration_summary_lists_phases_per_iteration() -> None:
+    first = IterationRecord(
+        iteration=1,
+        started_at=datetime(2026, 1, 1),
+        steps=[
+            StepRecord(phase=LoopPhase.IMPLEMENTATION, status=StepStatus.COMPLETED),
+            StepRecord(phase=LoopPhase.TEST_CRITIQUE, status=StepStatus.COMPLETED),
+            StepRecord(phase=LoopPhase.CODE_QUALITY, status=StepStatus.FAILED),
+        ],
+    )
+    second = IterationRecord(
+        iteration=2,
+        started_at=datetime(2026, 1, 1),
+        steps=[StepRecord(phase=LoopPhase.DOD_CHECK, status=StepStatus.COMPLETED)],
+        dod_achieved=True,
+    )
+    state = ExecutionState(
+        task_id="task-01",
+        task_path=Path("docs/tasks/task-01"),
+        iterations=[first, second],
+    )
+
+    assert NtfyHook(topic="saha-test", enabled=False)._build_iteration_summary(state) == (
+        "Iter 1: FAIL\n"
+        "  Done: Implementation, Test Critique\n"
+        "  Failed: Code Quality\n"
+        "Iter 2: PASS\n"
+        "  Done: Dod Check\n"
+        "\nDoD: PASSED"
+    )
+
+
+class _ExplodingState:
+    @property
+    def task_id(self) -> str:
+        raise AssertionError("state should not be read for a disabled level")
+
+
+def test_logging_hook_skips_disabled_levels(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, logger=notification.__name__)
+
+    LoggingHook(log_level=logging.DEBUG).execute(HookEvent.QA_START, state=_ExplodingState())
+    LoggingHook().execute(HookEvent.QA_START)
+
+    assert caplog.messages == ["[unknown] Event: qa_start (iteration 0)"]
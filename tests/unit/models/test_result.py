@@ -0,0 +1,23 @@
+"""Unit tests for result models."""
+
+import pytest
+from pydantic import ValidationError
+
+from saha.models.result import ResultStatus, ToolResult
+
+
+def test_tool_result_is_read_only() -> None:
+    result = ToolResult(tool_name="ruff", status=ResultStatus.SUCCESS)
+
+    with pytest.raises(ValidationError):
+        result.exit_code = 1
+
+
+def test_tool_result_repr_omits_captured_output() -> None:
+    result = ToolResult(
+        tool_name="pytest", status=ResultStatus.FAILURE, exit_code=1, stdout="x" * 10_000
+    )
+
+    assert "stdout" not in repr(result)
+    assert "exit_code=1" in repr(result)
+    assert not result.passed
@@ -0,0 +1,64 @@
+"""Unit tests for execution state models."""
+
+from pathlib import Path
+
+from saha.models.state import ExecutionState, IterationRecord, LoopPhase, StepStatus
+
+
+def _state() -> ExecutionState:
+    return ExecutionState(task_id="task-01", task_path=Path("docs/tasks/task-01"))
+
+
+def test_record_step_starts_an_iteration_with_fresh_lists() -> None:
+    state = _state()
+
+    step = state.record_step(LoopPhase.QA, StepStatus.IN_PROGRESS)
+    state.start_iteration()
+
+    first, second = state.iterations
+    assert first.steps == [step]
+    assert second.steps == []
+    assert first.files_changed is not second.files_changed
+    assert step.started_at is not None
+    assert step.completed_at is None
+    assert step.attempt == 1
+
+
+def test_recorded_state_round_trips_through_validation() -> None:
+    state = _state()
+    state.record_step(LoopPhase.IMPLEMENTATION, StepStatus.COMPLETED, output_summary="ok")
+    state.record_step(LoopPhase.QA, StepStatus.FAILED, error="tests failed")
+
+    loaded = ExecutionState.model_validate(state.model_dump(mode="json"))
+
+    assert loaded == state
+    assert isinstance(loaded.iterations[0], IterationRecord)
+    assert loaded.iterations[0].steps[1].status is StepStatus.FAILED
+
+
+def test_is_running_only_for_active_phases() -> None:
+    state = _state()
+    running = set()
+    for phase in LoopPhase:
+        state.current_phase = phase
+        if state.is_running:
+            running.add(phase)
+
+    assert running == {
+        LoopPhase.IMPLEMENTATION,
+        LoopPhase.TEST_CRITIQUE,
+        LoopPhase.QA,
+        LoopPhase.CODE_QUALITY,
+        LoopPhase.MANAGER,
+        LoopPhase.DOD_CHECK,
+    }
+
+
+def test_current_iteration_record_tracks_latest_iteration() -> None:
+    state = _state()
+    assert state.current_iteration_record is None
+
+    state.start_iteration()
+    latest = state.start_iteration()
+
+    assert state.current_iteration_record is latest
@@ -0,0 +1,113 @@
+"""Unit tests for orchestrator factory helpers."""
+
+import subprocess
+import sys
+
+import pytest
+import typer
+
+from saha.config.settings import AgentRunnerConfig, AgentsConfig, Settings
+from saha.orchestrator.factory import _create_default_runner, validate_configured_runners
+from saha.runners.claude import ClaudeRunner, MockRunner
+from saha.runners.codex import CodexRunner
+from saha.runners.gemini import GeminiRunner
+from saha.runners.registry import RunnerRegistry, RunnerType
+
+
+class _ProbedRunner(MockRunner):
+    def __init__(self, available: bool) -> None:
+        super().__init__()
+        self.available = available
+        self.probes = 0
+
+    def is_available(self) -> bool:
+        self.probes += 1
+        return self.available
+
+
+def _registry(runner: MockRunner) -> RunnerRegistry:
+    registry = RunnerRegistry()
+    registry.register_instance(RunnerType.CLAUDE, runner)
+    return registry
+
+
+def test_runner_availability_is_probed_once_per_runner() -> None:
+    runner = _ProbedRunner(available=True)
+    registry = _registry(runner)
+
+    validate_configured_runners(registry, Settings())
+    validate_configured_runners(registry, Settings())
+
+    assert runner.probes == 1
+
+
+def test_availability_is_probed_again_by_a_new_registry() -> None:
+    runner = _ProbedRunner(available=False)
+    registry = _registry(runner)
+    assert not registry.is_runner_available(RunnerType.CLAUDE)
+
+    # A CLI installed since the last check is picked up by the next registry
+    runner.available = True
+    assert _registry(runner).is_runner_available(RunnerType.CLAUDE)
+
+    replacement = _ProbedRunner(available=True)
+    registry.register_instance(RunnerType.CLAUDE, replacement)
+    assert registry.is_runner_available(RunnerType.CLAUDE)
+    assert (runner.probes, replacement.probes) == (2, 1)
+
+
+def test_unavailable_runner_fails_validation(capsys: pytest.CaptureFixture[str]) -> None:
+    registry = _registry(_ProbedRunner(available=False))
+
+    with pytest.raises(typer.Exit):
+        validate_configured_runners(registry, Settings())
+
+    assert capsys.readouterr().err == (
+        "Error: The following configured runners are not available:\n"
+        "  - mock\n"
+        "\n"
+        "Install missing CLIs or change runner configuration.\n"
+    )
+
+
+@pytest.mark.parametrize(
+    ("runner", "expected"),
+    [
+        ("mock", MockRunner),
+        ("gemini", GeminiRunner),
+        ("codex", CodexRunner),
+        ("claude", ClaudeRunner),
+    ],
+)
+def test_default_runner_matches_settings(runner: str, expected: type) -> None:
+    assert type(_create_default_runner(Settings(runner=runner))) is expected
+
+
+def test_backend_runners_are_imported_on_first_use() -> None:
+    code = (
+        "import sys\n"
+        "from saha.config.settings import Settings\n"
+        "from saha.orchestrator.factory import create_runner_registry\n"
+        "registry = create_runner_registry(Settings(_env_file=None))\n"
+        "print(type(registry.get_runner_for_agent('execution-qa')).__name__)\n"
+        "print('saha.runners.codex' in sys.modules, 'saha.runners.gemini' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split("\n")[:2] == ["ClaudeRunner", "False False"]
+
+
+def test_mock_runner_is_never_probed() -> None:
+    registry = RunnerRegistry()
+    runner = _ProbedRunner(available=False)
+    registry.register_instance(RunnerType.MOCK, runner)
+    mock = AgentRunnerConfig(runner="mock")
+    agents = AgentsConfig(
+        default_runner="mock", implementer=mock, qa=mock, code_quality=mock, manager=mock, dod=mock
+    )
+
+    validate_configured_runners(registry, Settings(agents=agents))
+
+    assert runner.probes == 0
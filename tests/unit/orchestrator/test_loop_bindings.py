@@ -0,0 +1,63 @@
+"""Unit tests for per-loop agent path and runner lookups."""
+
+from pathlib import Path
+
+import pytest
+
+from saha.config.settings import AgentRunnerConfig, AgentsConfig, Settings
+from saha.hooks.registry import HookRegistry
+from saha.orchestrator.loop import AgenticLoop
+from saha.orchestrator.state import StateManager
+from saha.runners.claude import MockRunner
+from saha.runners.registry import RunnerRegistry, RunnerType
+from saha.tools.registry import ToolRegistry
+
+
+def _loop(tmp_path: Path, settings: Settings, registry: RunnerRegistry | None = None):
+    return AgenticLoop(
+        runner=MockRunner(),
+        tool_registry=ToolRegistry(),
+        hook_registry=HookRegistry(),
+        state_manager=StateManager(tmp_path / ".sahaidachny"),
+        settings=settings,
+        runner_registry=registry,
+    )
+
+
+def test_agent_path_is_resolved_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings(agents=AgentsConfig(qa=AgentRunnerConfig(variant="playwright")))
+    loop = _loop(tmp_path, settings)
+    calls: list[str] = []
+    original = Settings.get_agent_runner_config
+
+    def counting(self: Settings, agent_name: str) -> AgentRunnerConfig:
+        calls.append(agent_name)
+        return original(self, agent_name)
+
+    monkeypatch.setattr(Settings, "get_agent_runner_config", counting)
+
+    first = loop._get_agent_path("execution_qa")
+    assert loop._get_agent_path("execution_qa") is first
+    assert first == settings.get_agent_path("execution_qa", variant="playwright")
+    assert calls == ["execution-qa"]
+
+
+def test_runner_for_agent_is_looked_up_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    registry = RunnerRegistry()
+    runner = MockRunner()
+    registry.register_instance(RunnerType.CLAUDE, runner)
+    loop = _loop(tmp_path, Settings(), registry)
+    lookups: list[str] = []
+    original = RunnerRegistry.get_runner_for_agent
+
+    def counting(self: RunnerRegistry, agent_name: str):
+        lookups.append(agent_name)
+        return original(self, agent_name)
+
+    monkeypatch.setattr(RunnerRegistry, "get_runner_for_agent", counting)
+
+    assert loop._get_runner_for_agent("execution-qa") is runner
+    assert loop._get_runner_for_agent("execution-qa") is runner
+    assert lookups == ["execution-qa"]
@@ -0,0 +1,48 @@
+"""Unit tests for StateManager persistence helpers."""
+
+from pathlib import Path
+
+from saha.models.state import LoopPhase
+from saha.orchestrator.state import StateManager
+
+
+def test_load_many_preserves_order_and_missing_tasks(tmp_path: Path) -> None:
+    manager = StateManager(tmp_path / ".sahaidachny")
+    for task_id in ("task-01", "task-02", "task-03"):
+        manager.create(task_id=task_id, task_path=tmp_path / task_id, max_iterations=3)
+
+    states = manager.load_many(["task-03", "task-missing", "task-01"])
+
+    assert [s.task_id if s else None for s in states] == ["task-03", None, "task-01"]
+
+
+def test_load_many_does_not_replace_current_state(tmp_path: Path) -> None:
+    manager = StateManager(tmp_path / ".sahaidachny")
+    manager.create(task_id="task-01", task_path=tmp_path / "task-01")
+    current = manager.create(task_id="task-02", task_path=tmp_path / "task-02")
+
+    manager.load_many(["task-01", "task-02"])
+
+    assert manager.current_state is current
+
+
+def test_delete_many_reports_per_task(tmp_path: Path) -> None:
+    manager = StateManager(tmp_path / ".sahaidachny")
+    for task_id in ("task-01", "task-02"):
+        manager.create(task_id=task_id, task_path=tmp_path / task_id)
+
+    assert manager.delete_many(["task-01", "task-missing", "task-02"]) == [True, False, True]
+    assert manager.list_tasks() == []
+    assert manager.current_state is None
+
+
+def test_saved_state_round_trips(tmp_path: Path) -> None:
+    manager = StateManager(tmp_path / ".sahaidachny")
+    state = manager.create(task_id="task-01", task_path=tmp_path / "task-01")
+    manager.complete_phase(state, LoopPhase.IMPLEMENTATION, output_summary="line one\nline: two")
+    manager.fail_phase(state, LoopPhase.QA, error="tests failed")
+
+    loaded = StateManager(manager.state_dir).load("task-01")
+
+    assert loaded == state
+    assert loaded.current_phase is LoopPhase.FAILED
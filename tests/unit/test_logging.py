@@ -0,0 +1,87 @@
+"""Unit tests for Sahaidachny log filtering."""
+
+import logging
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from saha.logging import SahaLogFilter
+
+
+def _record(level: int, msg: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord("saha.test", level, __file__, 1, msg, args, None)
+
+
+@pytest.mark.parametrize(
+    ("msg", "args", "expected"),
+    [
+        ("Command exit code: %d", (0,), False),
+        ("Command stderr: %s", ("boom",), False),
+        ("Executing command: claude", (), False),
+        ("Starting phase %s", ("qa",), True),
+    ],
+)
+def test_verbose_command_messages_are_filtered(
+    msg: str, args: tuple[object, ...], expected: bool
+) -> None:
+    assert SahaLogFilter().filter(_record(logging.INFO, msg, *args)) is expected
+
+
+def test_debug_mode_keeps_everything() -> None:
+    assert SahaLogFilter(debug=True).filter(_record(logging.INFO, "Command exit code: 1"))
+
+
+def test_warnings_pass_without_formatting_the_message() -> None:
+    record = _record(logging.WARNING, "Command stderr: %s %s", "missing arg")
+
+    # Formatting this record would raise; the filter must not need to
+    assert SahaLogFilter().filter(record)
+
+
+def test_task_stopped_banner_is_printed_in_one_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    from saha import logging as saha_logging
+
+    printed: list[str] = []
+    monkeypatch.setattr(saha_logging, "get_console", lambda: SimpleNamespace(print=printed.append))
+
+    saha_logging.log_task_stopped("task-01", "user requested stop")
+
+    assert len(printed) == 1
+    lines = printed[0].split("\n")
+    assert lines[1] == lines[-1] == saha_logging._WARNING_RULE_LINE
+    assert "Reason: user requested stop" in printed[0]
+
+
+def test_agent_prompt_is_rendered_verbatim_in_one_panel(monkeypatch: pytest.MonkeyPatch) -> None:
+    from rich.console import Console
+
+    from saha import logging as saha_logging
+
+    console = Console(theme=saha_logging.SAHA_THEME, width=80)
+    monkeypatch.setattr(saha_logging, "get_console", lambda: console)
+
+    with console.capture() as capture:
+        saha_logging.log_agent_prompt("QA", "check [bold]tags[/bold]\nsecond line")
+
+    output = capture.get()
+    assert "Prompt → QA" in output
+    assert "check [bold]tags[/bold]" in output
+    assert "second line" in output
+
+
+def test_importing_module_does_not_import_rich() -> None:
+    code = "import sys, saha.logging; print(any(m.startswith('rich') for m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_console_is_created_on_first_access() -> None:
+    from saha import logging as saha_logging
+
+    assert saha_logging.console is saha_logging.get_console()
+    assert saha_logging.SAHA_THEME.styles["phase"] is not None